@@ -0,0 +1,75 @@
+"""Store interaction, notification and session keys as native UUIDs
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+# (table, column, type before this migration)
+UUID_COLUMNS = [
+    ('interaction_logs', 'id', sa.String(36)),
+    ('interaction_logs', 'customer_id', sa.String(36)),
+    ('call_interactions', 'id', sa.String(36)),
+    ('call_interactions', 'interaction_id', sa.String(36)),
+    ('message_interactions', 'id', sa.String(36)),
+    ('message_interactions', 'interaction_id', sa.String(36)),
+    ('notifications', 'id', sa.String()),
+    ('notifications', 'customer_id', sa.String()),
+    ('notification_preferences', 'id', sa.String()),
+    ('notification_preferences', 'customer_id', sa.String()),
+    ('user_sessions', 'id', sa.String(36)),
+]
+
+# Foreign keys into interaction_logs.id must be dropped while its type changes
+INTERACTION_FKS = ['call_interactions', 'message_interactions']
+
+
+def _drop_interaction_fks():
+    for table in INTERACTION_FKS:
+        op.drop_constraint(f'{table}_interaction_id_fkey', table, type_='foreignkey')
+
+
+def _create_interaction_fks():
+    for table in INTERACTION_FKS:
+        op.create_foreign_key(
+            f'{table}_interaction_id_fkey',
+            table, 'interaction_logs',
+            ['interaction_id'], ['id']
+        )
+
+
+def upgrade():
+    _drop_interaction_fks()
+
+    # Existing values are textual UUIDs, so cast them in place
+    for table, column, _ in UUID_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.UUID(as_uuid=True),
+            postgresql_using=f'{column}::uuid'
+        )
+
+    _create_interaction_fks()
+
+
+def downgrade():
+    _drop_interaction_fks()
+
+    for table, column, old_type in UUID_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=old_type,
+            postgresql_using=f'{column}::text'
+        )
+
+    _create_interaction_fks()
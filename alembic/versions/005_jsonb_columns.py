@@ -0,0 +1,56 @@
+"""Store JSON columns as JSONB and index project amenities
+
+Revision ID: 004
+Revises: 003
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '004'
+down_revision = '003'
+branch_labels = None
+depends_on = None
+
+JSONB_COLUMNS = [
+    ('interaction_logs', 'user_input'),
+    ('interaction_logs', 'model_metadata'),
+    ('call_interactions', 'keypad_inputs'),
+    ('call_interactions', 'menu_selections'),
+    ('call_interactions', 'call_quality_metrics'),
+    ('call_interactions', 'model_metadata'),
+    ('message_interactions', 'model_metadata'),
+    ('outreach', 'variables'),
+    ('outreach_templates', 'variables'),
+    ('outreach_campaigns', 'campaign_metadata'),
+    ('projects', 'amenities'),
+    ('projects', 'model_metadata'),
+]
+
+
+def upgrade():
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(),
+            postgresql_using=f'{column}::jsonb'
+        )
+
+    op.create_index(
+        'ix_projects_amenities_gin', 'projects', ['amenities'],
+        postgresql_using='gin'
+    )
+
+
+def downgrade():
+    op.drop_index('ix_projects_amenities_gin', table_name='projects')
+
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(),
+            postgresql_using=f'{column}::json'
+        )
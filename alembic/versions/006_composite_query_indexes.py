@@ -0,0 +1,49 @@
+"""Add composite indexes for the main list and stats queries
+
+Revision ID: 005
+Revises: 004
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '005'
+down_revision = '004'
+branch_labels = None
+depends_on = None
+
+COMPOSITE_INDEXES = [
+    ('ix_notifications_user_unread', 'notifications', ['user_id', 'is_read', 'created_at']),
+    ('ix_interaction_logs_lead_start', 'interaction_logs', ['lead_id', 'start_time']),
+    ('ix_outreach_logs_customer_status_created', 'outreach_logs', ['customer_id', 'status', 'created_at']),
+    ('ix_outreach_logs_lead_created', 'outreach_logs', ['lead_id', 'created_at']),
+    ('ix_user_sessions_user_active_expires', 'user_sessions', ['user_id', 'is_active', 'expires_at']),
+]
+
+# Single-column indexes on primary keys, which the primary key already indexes
+REDUNDANT_ID_INDEXES = [
+    ('ix_interaction_logs_id', 'interaction_logs'),
+    ('ix_call_interactions_id', 'call_interactions'),
+    ('ix_message_interactions_id', 'message_interactions'),
+    ('ix_notifications_id', 'notifications'),
+    ('ix_notification_preferences_id', 'notification_preferences'),
+    ('ix_user_sessions_id', 'user_sessions'),
+]
+
+
+def upgrade():
+    for name, table, columns in COMPOSITE_INDEXES:
+        op.create_index(name, table, columns)
+
+    # Only databases built from the old models' index=True have these
+    for name, _ in REDUNDANT_ID_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+def downgrade():
+    for name, table in REDUNDANT_ID_INDEXES:
+        op.create_index(name, table, ['id'])
+
+    for name, table, _ in COMPOSITE_INDEXES:
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,52 @@
+"""Store notification timestamps as timestamptz with server defaults
+
+Revision ID: 006
+Revises: 005
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '006'
+down_revision = '005'
+branch_labels = None
+depends_on = None
+
+# (table, column, has a now() server default)
+TIMESTAMP_COLUMNS = [
+    ('notifications', 'created_at', True),
+    ('notifications', 'read_at', False),
+    ('notification_preferences', 'created_at', True),
+    ('notification_preferences', 'updated_at', True),
+]
+
+
+def upgrade():
+    # Existing values were written by datetime.utcnow(), i.e. naive UTC
+    for table, column, has_default in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            server_default=sa.func.now() if has_default else None
+        )
+
+    op.execute("UPDATE notifications SET created_at = now() WHERE created_at IS NULL")
+    op.execute("UPDATE notification_preferences SET created_at = now() WHERE created_at IS NULL")
+    op.alter_column('notifications', 'created_at', nullable=False)
+    op.alter_column('notification_preferences', 'created_at', nullable=False)
+
+
+def downgrade():
+    op.alter_column('notifications', 'created_at', nullable=True)
+    op.alter_column('notification_preferences', 'created_at', nullable=True)
+
+    for table, column, _ in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            server_default=None
+        )
@@ -0,0 +1,35 @@
+"""Bound short provider and notification string columns
+
+Revision ID: 007
+Revises: 006
+Create Date: 2026-10-16 14:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '007'
+down_revision = '006'
+branch_labels = None
+depends_on = None
+
+# (table, column, new type)
+BOUNDED_COLUMNS = [
+    ('call_interactions', 'call_sid', sa.String(34)),
+    ('message_interactions', 'message_id', sa.String(255)),
+    ('message_interactions', 'delivery_status', sa.String(32)),
+    ('notifications', 'title', sa.String(200)),
+    ('notifications', 'message', sa.Text()),
+    ('notifications', 'type', sa.String(50)),
+]
+
+
+def upgrade():
+    for table, column, type_ in BOUNDED_COLUMNS:
+        op.alter_column(table, column, type_=type_)
+
+
+def downgrade():
+    for table, column, _ in BOUNDED_COLUMNS:
+        op.alter_column(table, column, type_=sa.String())
@@ -0,0 +1,67 @@
+"""Store outreach and interaction enums as checked VARCHAR values
+
+Revision ID: 008
+Revises: 007
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '008'
+down_revision = '007'
+branch_labels = None
+depends_on = None
+
+# Enum name -> member values; each member's name is its value upper-cased
+ENUMS = {
+    'interactiontype': ['call', 'sms', 'email', 'whatsapp', 'telegram'],
+    'interactionstatus': ['success', 'failed', 'pending', 'no_response'],
+    'outreachchannel': ['email', 'sms', 'call', 'whatsapp'],
+    'outreachstatus': ['pending', 'scheduled', 'sent', 'delivered', 'read', 'failed', 'cancelled'],
+    'campaignstatus': ['draft', 'scheduled', 'running', 'completed', 'failed', 'cancelled'],
+}
+
+# (table, column, enum name)
+ENUM_COLUMNS = [
+    ('interaction_logs', 'interaction_type', 'interactiontype'),
+    ('interaction_logs', 'status', 'interactionstatus'),
+    ('outreach', 'channel', 'outreachchannel'),
+    ('outreach', 'status', 'outreachstatus'),
+    ('outreach_templates', 'channel', 'outreachchannel'),
+    ('outreach_logs', 'channel', 'outreachchannel'),
+    ('outreach_logs', 'status', 'outreachstatus'),
+    ('communication_preferences', 'default_channel', 'outreachchannel'),
+    ('outreach_campaigns', 'channel', 'outreachchannel'),
+    ('outreach_campaigns', 'status', 'campaignstatus'),
+]
+
+
+def upgrade():
+    # Native ENUMs stored member names; the columns now store member values
+    for table, column, enum_name in ENUM_COLUMNS:
+        values = ENUMS[enum_name]
+        op.alter_column(
+            table, column,
+            type_=sa.String(max(len(value) for value in values)),
+            postgresql_using=f'lower({column}::text)'
+        )
+        op.create_check_constraint(enum_name, table, sa.column(column).in_(values))
+
+    for enum_name in ENUMS:
+        op.execute(f'DROP TYPE IF EXISTS {enum_name}')
+
+
+def downgrade():
+    for enum_name, values in ENUMS.items():
+        postgresql.ENUM(*(value.upper() for value in values), name=enum_name).create(op.get_bind())
+
+    for table, column, enum_name in ENUM_COLUMNS:
+        op.drop_constraint(enum_name, table, type_='check')
+        op.alter_column(
+            table, column,
+            type_=postgresql.ENUM(name=enum_name, create_type=False),
+            postgresql_using=f'upper({column})::{enum_name}'
+        )
@@ -0,0 +1,43 @@
+"""Narrow unread-notification and active-session indexes to those rows
+
+Revision ID: 009
+Revises: 008
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '009'
+down_revision = '008'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_index('ix_notifications_user_unread', table_name='notifications')
+    op.create_index(
+        'ix_notifications_unread', 'notifications', ['user_id', 'created_at'],
+        postgresql_where=sa.text('is_read = false')
+    )
+
+    op.drop_index('ix_user_sessions_user_active_expires', table_name='user_sessions')
+    op.create_index(
+        'ix_user_sessions_active', 'user_sessions', ['user_id', 'expires_at'],
+        postgresql_where=sa.text('is_active = true')
+    )
+
+
+def downgrade():
+    op.drop_index('ix_user_sessions_active', table_name='user_sessions')
+    op.create_index(
+        'ix_user_sessions_user_active_expires', 'user_sessions',
+        ['user_id', 'is_active', 'expires_at']
+    )
+
+    op.drop_index('ix_notifications_unread', table_name='notifications')
+    op.create_index(
+        'ix_notifications_user_unread', 'notifications',
+        ['user_id', 'is_read', 'created_at']
+    )
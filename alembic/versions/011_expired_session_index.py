@@ -0,0 +1,26 @@
+"""Index active sessions by expiry for the expired-session sweep
+
+Revision ID: 010
+Revises: 009
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '010'
+down_revision = '009'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_user_sessions_expired', 'user_sessions', ['expires_at'],
+        postgresql_where=sa.text('is_active = true')
+    )
+
+
+def downgrade():
+    op.drop_index('ix_user_sessions_expired', table_name='user_sessions')
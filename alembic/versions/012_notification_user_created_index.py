@@ -0,0 +1,22 @@
+"""Index notifications by user and creation time for the recent list
+
+Revision ID: 011
+Revises: 010
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '011'
+down_revision = '010'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index('ix_notifications_user_created', 'notifications', ['user_id', 'created_at'])
+
+
+def downgrade():
+    op.drop_index('ix_notifications_user_created', table_name='notifications')
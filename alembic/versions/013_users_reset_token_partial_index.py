@@ -0,0 +1,33 @@
+"""Index only pending reset tokens and drop the redundant users id index
+
+Revision ID: 012
+Revises: 011
+Create Date: 2026-10-16 19:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '012'
+down_revision = '011'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_users_reset_token', 'users', ['reset_token'], unique=True,
+        postgresql_where=sa.text('reset_token IS NOT NULL')
+    )
+    op.drop_constraint('users_reset_token_key', 'users', type_='unique')
+
+    # The primary key already indexes id
+    op.execute('DROP INDEX IF EXISTS ix_users_id')
+
+
+def downgrade():
+    op.create_index('ix_users_id', 'users', ['id'])
+
+    op.create_unique_constraint('users_reset_token_key', 'users', ['reset_token'])
+    op.drop_index('ix_users_reset_token', table_name='users')
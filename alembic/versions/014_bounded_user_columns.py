@@ -0,0 +1,37 @@
+"""Bound user, role and permission string columns
+
+Revision ID: 013
+Revises: 012
+Create Date: 2026-10-16 20:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '013'
+down_revision = '012'
+branch_labels = None
+depends_on = None
+
+# (table, column, new type)
+BOUNDED_COLUMNS = [
+    ('users', 'email', sa.String(254)),
+    ('users', 'username', sa.String(50)),
+    ('users', 'password_hash', sa.String(60)),
+    ('users', 'reset_token', sa.String(43)),
+    ('roles', 'name', sa.String(50)),
+    ('roles', 'description', sa.String(255)),
+    ('permissions', 'name', sa.String(50)),
+    ('permissions', 'description', sa.String(255)),
+]
+
+
+def upgrade():
+    for table, column, type_ in BOUNDED_COLUMNS:
+        op.alter_column(table, column, type_=type_)
+
+
+def downgrade():
+    for table, column, _ in BOUNDED_COLUMNS:
+        op.alter_column(table, column, type_=sa.String())
@@ -0,0 +1,45 @@
+"""Store user, role and permission timestamps as timestamptz with server defaults
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-16 21:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+TIMESTAMP_COLUMNS = [
+    (table, column)
+    for table in ('users', 'roles', 'permissions')
+    for column in ('created_at', 'updated_at')
+]
+
+
+def upgrade():
+    # Existing values were written by datetime.utcnow(), i.e. naive UTC
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            server_default=sa.func.now()
+        )
+        op.execute(f"UPDATE {table} SET {column} = now() WHERE {column} IS NULL")
+        op.alter_column(table, column, nullable=False)
+
+
+def downgrade():
+    for table, column in TIMESTAMP_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'",
+            server_default=None,
+            nullable=True
+        )
@@ -0,0 +1,32 @@
+"""Store user metadata as JSONB
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-16 22:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.alter_column(
+        'users', 'model_metadata',
+        type_=postgresql.JSONB(),
+        postgresql_using='model_metadata::jsonb'
+    )
+
+
+def downgrade():
+    op.alter_column(
+        'users', 'model_metadata',
+        type_=sa.JSON(),
+        postgresql_using='model_metadata::json'
+    )
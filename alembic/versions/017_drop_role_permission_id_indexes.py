@@ -0,0 +1,31 @@
+"""Drop the redundant roles and permissions id indexes
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-16 23:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+# Single-column indexes on primary keys, which the primary key already indexes
+REDUNDANT_ID_INDEXES = [
+    ('ix_roles_id', 'roles'),
+    ('ix_permissions_id', 'permissions'),
+]
+
+
+def upgrade():
+    # Only databases built from the old models' index=True have these
+    for name, _ in REDUNDANT_ID_INDEXES:
+        op.execute(f'DROP INDEX IF EXISTS {name}')
+
+
+def downgrade():
+    for name, table in REDUNDANT_ID_INDEXES:
+        op.create_index(name, table, ['id'])
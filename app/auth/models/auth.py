@@ -1,7 +1,8 @@
 import uuid
 from datetime import datetime
 
-from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, String
+from sqlalchemy import JSON, Boolean, Column, DateTime, ForeignKey, Index, String, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -34,9 +35,20 @@ class MFASettings(BaseModel):
 
 class UserSession(BaseModel):
     __tablename__ = "user_sessions"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # A user's active, unexpired sessions; inactive ones are left out
+        Index(
+            "ix_user_sessions_active", "user_id", "expires_at",
+            postgresql_where=text("is_active = true")
+        ),
+        # Range scan for the expired-session sweep
+        Index(
+            "ix_user_sessions_expired", "expires_at",
+            postgresql_where=text("is_active = true")
+        ),
+    )
     
-    id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
     refresh_token = Column(String, unique=True, nullable=False)
     jti = Column(String, unique=True, nullable=False)  # JWT ID for token tracking
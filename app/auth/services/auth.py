@@ -9,9 +9,9 @@ from typing import Any, Dict, List, Optional
 
 import pyotp
 import qrcode
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.orm import Session
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from app.auth.models.auth import (MFASettings, UserSession)
 from app.shared.core.audit import AuditService
@@ -43,13 +43,10 @@ from typing import Dict
 from typing import Any
 from datetime import timedelta
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    return pwd_context.hash(password)
+# Hot user lookups, built once and reused with bound parameters
+_USER_BY_EMAIL = select(User).where(User.email == bindparam("email"))
+_USER_BY_USERNAME = select(User).where(User.username == bindparam("username"))
+_USER_BY_ID = select(User).where(User.id == bindparam("user_id"))
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     to_encode = data.copy()
@@ -280,6 +277,15 @@ class AuthService:
         ).update({"is_active": False})
         self.db.commit()
 
+    async def purge_expired_sessions(self) -> int:
+        """Delete active sessions past their expiry and return how many were removed."""
+        deleted = self.db.query(UserSession).filter(
+            UserSession.is_active,
+            UserSession.expires_at < func.now()
+        ).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted
+
     async def refresh_session(self, refresh_token: str) -> Optional[Dict[str, Any]]:
         """Refresh a session."""
         session = await self.get_session_by_token(refresh_token)
@@ -429,7 +435,7 @@ class AuthService:
 
     def get_user_by_id(self, user_id: str) -> Optional[User]:
         """Get a user by ID."""
-        return self.db.query(User).filter(User.id == user_id).first()
+        return self.db.scalars(_USER_BY_ID, {"user_id": user_id}).first()
 
     def get_users(
         self,
@@ -467,10 +473,10 @@ class AuthService:
         return user
 
     async def get_user_by_email(self, email: str) -> Optional[User]:
-        return self.db.query(User).filter(User.email == email.lower()).first()
+        return self.db.scalars(_USER_BY_EMAIL, {"email": email.lower()}).first()
 
     async def get_user_by_username(self, username: str) -> Optional[User]:
-        return self.db.query(User).filter(User.username == username).first()
+        return self.db.scalars(_USER_BY_USERNAME, {"username": username}).first()
 
     async def create_user(self, user_data: UserCreate) -> User:
         # Check if email already exists
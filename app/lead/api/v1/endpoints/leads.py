@@ -13,8 +13,11 @@ from app.shared.models.user import User
 
 router = APIRouter()
 
-@require_role([Role.ADMIN, Role.AGENT])
-@router.post("/upload", response_model=LeadUploadResponse)
+@router.post(
+    "/upload",
+    response_model=LeadUploadResponse,
+    dependencies=[Depends(require_role([Role.ADMIN, Role.AGENT]))]
+)
 async def upload_leads(
     file: UploadFile = File(...),
     db: Session = Depends(deps.get_db),
@@ -24,8 +27,11 @@ async def upload_leads(
     lead_service = LeadService(db)
     return await lead_service.upload_leads(db, file, current_user)
 
-@require_role([Role.ADMIN, Role.AGENT])
-@router.get("/", response_model=List[LeadResponse])
+@router.get(
+    "/",
+    response_model=List[LeadResponse],
+    dependencies=[Depends(require_role([Role.ADMIN, Role.AGENT]))]
+)
 async def get_leads(
     skip: int = 0,
     limit: int = 100,
@@ -36,8 +42,11 @@ async def get_leads(
     lead_service = LeadService(db)
     return await lead_service.get_leads(db, skip, limit, current_user)
 
-@require_role([Role.ADMIN, Role.AGENT])
-@router.post("/", response_model=LeadResponse)
+@router.post(
+    "/",
+    response_model=LeadResponse,
+    dependencies=[Depends(require_role([Role.ADMIN, Role.AGENT]))]
+)
 async def create_lead(
     lead_in: LeadCreate,
     db: Session = Depends(deps.get_db),
@@ -47,8 +56,11 @@ async def create_lead(
     lead_service = LeadService(db)
     return await lead_service.create_lead(db, lead_in, current_user)
 
-@require_role([Role.ADMIN, Role.AGENT])
-@router.get("/{lead_id}", response_model=LeadResponse)
+@router.get(
+    "/{lead_id}",
+    response_model=LeadResponse,
+    dependencies=[Depends(require_role([Role.ADMIN, Role.AGENT]))]
+)
 async def get_lead(
     lead_id: str,
     db: Session = Depends(deps.get_db),
@@ -64,8 +76,11 @@ async def get_lead(
         )
     return lead
 
-@require_role([Role.ADMIN, Role.AGENT])
-@router.put("/{lead_id}", response_model=LeadResponse)
+@router.put(
+    "/{lead_id}",
+    response_model=LeadResponse,
+    dependencies=[Depends(require_role([Role.ADMIN, Role.AGENT]))]
+)
 async def update_lead(
     lead_id: str,
     lead_in: LeadUpdate,
@@ -82,8 +97,10 @@ async def update_lead(
         )
     return lead
 
-@require_role([Role.ADMIN])
-@router.delete("/{lead_id}", status_code=status.HTTP_204_NO_CONTENT)
+@router.delete(
+    "/{lead_id}", status_code=status.HTTP_204_NO_CONTENT,
+    dependencies=[Depends(require_role([Role.ADMIN]))]
+)
 async def delete_lead(
     lead_id: str,
     db: Session = Depends(deps.get_db),
@@ -97,8 +114,11 @@ async def delete_lead(
             detail="Lead not found"
         )
 
-@require_role([Role.ADMIN, Role.AGENT])
-@router.post("/{lead_id}/activities", response_model=Any)
+@router.post(
+    "/{lead_id}/activities",
+    response_model=Any,
+    dependencies=[Depends(require_role([Role.ADMIN, Role.AGENT]))]
+)
 async def create_lead_activity(
     lead_id: str,
     activity_in: LeadActivityCreate,
@@ -109,8 +129,11 @@ async def create_lead_activity(
     lead_service = LeadService(db)
     return await lead_service.create_activity(db, lead_id, activity_in, current_user)
 
-@require_role([Role.ADMIN, Role.AGENT])
-@router.get("/{lead_id}/activities", response_model=List[Any])
+@router.get(
+    "/{lead_id}/activities",
+    response_model=List[Any],
+    dependencies=[Depends(require_role([Role.ADMIN, Role.AGENT]))]
+)
 async def list_lead_activities(
     lead_id: str,
     db: Session = Depends(deps.get_db),
@@ -120,8 +143,11 @@ async def list_lead_activities(
     lead_service = LeadService(db)
     return await lead_service.get_activities(db, lead_id, current_user)
 
-@require_role([Role.ADMIN, Role.AGENT])
-@router.post("/{lead_id}/assign", response_model=Any)
+@router.post(
+    "/{lead_id}/assign",
+    response_model=Any,
+    dependencies=[Depends(require_role([Role.ADMIN, Role.AGENT]))]
+)
 async def assign_lead(
     lead_id: str,
     user_id: str,
@@ -132,8 +158,11 @@ async def assign_lead(
     lead_service = LeadService(db)
     return await lead_service.assign_lead(db, lead_id, user_id, current_user)
 
-@require_role([Role.ADMIN, Role.AGENT])
-@router.get("/stats", response_model=Any)
+@router.get(
+    "/stats",
+    response_model=Any,
+    dependencies=[Depends(require_role([Role.ADMIN, Role.AGENT]))]
+)
 async def get_lead_stats(
     db: Session = Depends(deps.get_db),
     current_user: User = Depends(deps.get_current_active_user)
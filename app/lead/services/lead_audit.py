@@ -7,12 +7,6 @@ from sqlalchemy.orm import Session
 from app.lead.models.lead import Lead
 from app.lead.models.lead_activity import LeadActivity
 from app.lead.schemas.lead_audit import (LeadAuditLog, LeadAuditLogResponse,
-from sqlalchemy.orm import Session
-from datetime import datetime
-from sqlalchemy import func
-from sqlalchemy.orm import Session
-from datetime import datetime
-from sqlalchemy import func
                                          LeadAuditStats,
                                          LeadAuditStatsResponse)
 
@@ -53,7 +47,7 @@ class LeadAuditService:
         activities = query.order_by(desc(LeadActivity.created_at)).offset(skip).limit(limit).all()
         
         return LeadAuditLogResponse(
-            logs=[LeadAuditLog.from_orm(activity) for activity in activities],
+            logs=[LeadAuditLog.model_validate(activity) for activity in activities],
             total=total
         )
 
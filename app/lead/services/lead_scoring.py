@@ -3,28 +3,13 @@ from typing import Any, Dict, List, Optional
 from uuid import UUID
 
 from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
 from app.lead.models.lead import Lead, LeadScore
 from app.project.models.project import Project
 from app.shared.models.interaction import (CallInteraction, InteractionLog,
-from app.shared.models.interaction import InteractionLog
-from app.shared.models.interaction import CallInteraction
-from sqlalchemy.orm import Session
-from datetime import datetime
-from typing import Dict
-from typing import Any
-from sqlalchemy import func
-from datetime import timedelta
-from app.shared.models.interaction import InteractionLog
-from app.shared.models.interaction import CallInteraction
-from sqlalchemy.orm import Session
-from datetime import datetime
-from typing import Dict
-from typing import Any
-from sqlalchemy import func
-from datetime import timedelta
                                            MessageInteraction)
+from app.shared.db.loading import explicit_loading
 
 
 class LeadScoringService:
@@ -233,10 +218,32 @@ class LeadScoringService:
 
     def get_lead_interaction_history(self, lead_id: UUID) -> List[Dict[str, Any]]:
         """Get complete interaction history for a lead."""
-        interactions = self.db.query(InteractionLog).filter(
+        # Only columns are read below, so no relationships are loaded
+        interactions = self.db.query(InteractionLog).options(*explicit_loading()).filter(
             InteractionLog.lead_id == lead_id
         ).order_by(InteractionLog.start_time.desc()).all()
 
+        # Fetch the type-specific details for the whole history in two IN
+        # queries rather than one query per interaction
+        interaction_ids = [interaction.id for interaction in interactions]
+        call_details_by_id = {}
+        message_details_by_id = {}
+        if interaction_ids:
+            call_details_by_id = {
+                details.interaction_id: details
+                for details in self.db.query(CallInteraction).options(
+                    undefer_group("payload"), *explicit_loading()
+                ).filter(
+                    CallInteraction.interaction_id.in_(interaction_ids)
+                )
+            }
+            message_details_by_id = {
+                details.interaction_id: details
+                for details in self.db.query(MessageInteraction).options(*explicit_loading()).filter(
+                    MessageInteraction.interaction_id.in_(interaction_ids)
+                )
+            }
+
         history = []
         for interaction in interactions:
             interaction_data = {
@@ -251,29 +258,23 @@ class LeadScoringService:
             }
 
             # Add type-specific details
-            if interaction.interaction_type == "call":
-                call_details = self.db.query(CallInteraction).filter(
-                    CallInteraction.interaction_id == interaction.id
-                ).first()
-                if call_details:
-                    interaction_data["call_details"] = {
-                        "recording_url": call_details.recording_url,
-                        "transcript": call_details.transcript,
-                        "keypad_inputs": call_details.keypad_inputs,
-                        "menu_selections": call_details.menu_selections,
-                        "call_quality_metrics": call_details.call_quality_metrics
-                    }
-            elif interaction.interaction_type in ["sms", "email", "whatsapp", "telegram"]:
-                message_details = self.db.query(MessageInteraction).filter(
-                    MessageInteraction.interaction_id == interaction.id
-                ).first()
-                if message_details:
-                    interaction_data["message_details"] = {
-                        "content": message_details.content,
-                        "response_content": message_details.response_content,
-                        "response_time": message_details.response_time,
-                        "delivery_status": message_details.delivery_status
-                    }
+            call_details = call_details_by_id.get(interaction.id)
+            if call_details:
+                interaction_data["call_details"] = {
+                    "recording_url": call_details.recording_url,
+                    "transcript": call_details.transcript,
+                    "keypad_inputs": call_details.keypad_inputs,
+                    "menu_selections": call_details.menu_selections,
+                    "call_quality_metrics": call_details.call_quality_metrics
+                }
+            message_details = message_details_by_id.get(interaction.id)
+            if message_details:
+                interaction_data["message_details"] = {
+                    "content": message_details.content,
+                    "response_content": message_details.response_content,
+                    "response_time": message_details.response_time,
+                    "delivery_status": message_details.delivery_status
+                }
 
             history.append(interaction_data)
 
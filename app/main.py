@@ -15,6 +15,8 @@ from app.shared.core.exceptions import register_exception_handlers
 from app.shared.core.logging import log_error, log_request, logger
 from app.shared.core.logging import logger
 from app.shared.core.logging import logger
+from app.shared.core.sms import close_sms_batcher
+from app.shared.core.text_to_speech import close_tts_service
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
@@ -119,4 +121,6 @@ async def shutdown_event():
         message_code=MessageCode.SYSTEM_ERROR,
         message="Application shutdown"
     )
-    shutdown_scheduler() 
\ No newline at end of file
+    shutdown_scheduler()
+    await close_sms_batcher()
+    await close_tts_service() 
\ No newline at end of file
@@ -2,11 +2,8 @@ from uuid import uuid4
 
 from sqlalchemy import Column, DateTime, func
 from sqlalchemy.dialects.postgresql import UUID
-from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import func
-from sqlalchemy import func
 
-Base = declarative_base()
+from app.shared.db.base_class import Base
 
 class BaseModel(Base):
     __abstract__ = True
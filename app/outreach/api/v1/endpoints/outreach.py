@@ -6,10 +6,11 @@ from uuid import UUID
 import pandas as pd
 from fastapi import (APIRouter, Depends, File, HTTPException,
                      Query, UploadFile, status)
+from sqlalchemy import insert
 from sqlalchemy.orm import Session
 
 from app.lead.models import Lead
-from app.outreach.models.outreach import OutreachLog
+from app.outreach.models.outreach import OutreachLog, OutreachStatus
 from app.outreach.schemas.outreach import (CommunicationPreference,
                                            CommunicationPreferenceCreate,
                                            CommunicationPreferenceUpdate,
@@ -41,6 +42,19 @@ from app.shared.models.interaction import InteractionLog
 
 router = APIRouter()
 
+def _outreach_log_rows(lead: Lead, customer_id: Any, channel_results: dict) -> List[dict]:
+    """OutreachLog rows recording one lead's per-channel outreach results."""
+    return [
+        {
+            "lead_id": lead.id,
+            "customer_id": customer_id,
+            "channel": channel,
+            "status": OutreachStatus.SENT if success else OutreachStatus.FAILED,
+            "message": f"Outreach attempt via {channel}"
+        }
+        for channel, success in channel_results.items()
+    ]
+
 @router.post("/leads/{lead_id}/outreach")
 async def initiate_outreach(
     *,
@@ -80,17 +94,10 @@ async def initiate_outreach(
     # Send messages through all enabled channels
     results = await comm_service.send_all_channels(lead)
 
-    # Log outreach attempts
-    for channel, success in results.items():
-        log = OutreachLog(
-            lead_id=lead.id,
-            customer_id=current_user.customer_id,
-            channel=channel,
-            status="success" if success else "failed",
-            message=f"Outreach attempt via {channel}"
-        )
-        db.add(log)
-    
+    # Log outreach attempts in one multi-row INSERT
+    log_rows = _outreach_log_rows(lead, current_user.customer_id, results)
+    if log_rows:
+        db.execute(insert(OutreachLog), log_rows)
     db.commit()
 
     return {
@@ -122,32 +129,30 @@ async def initiate_bulk_outreach(
     # Initialize communication service
     comm_service = OutreachEngine(preferences)
 
+    # Fetch all requested leads in one query
+    leads = db.query(Lead).filter(
+        Lead.id.in_(lead_ids),
+        Lead.customer_id == current_user.customer_id
+    ).all()
+    leads_by_id = {str(lead.id): lead for lead in leads}
+
     results = []
+    log_rows = []
     for lead_id in lead_ids:
-        lead = db.query(Lead).filter(
-            Lead.id == lead_id,
-            Lead.customer_id == current_user.customer_id
-        ).first()
+        lead = leads_by_id.get(str(lead_id))
 
         if lead:
             channel_results = await comm_service.send_all_channels(lead)
-            
-            # Log outreach attempts
-            for channel, success in channel_results.items():
-                log = OutreachLog(
-                    lead_id=lead.id,
-                    customer_id=current_user.customer_id,
-                    channel=channel,
-                    status="success" if success else "failed",
-                    message=f"Outreach attempt via {channel}"
-                )
-                db.add(log)
+            log_rows.extend(_outreach_log_rows(lead, current_user.customer_id, channel_results))
             
             results.append({
                 "lead_id": str(lead_id),
                 "results": channel_results
             })
 
+    # Log every outreach attempt in one multi-row INSERT
+    if log_rows:
+        db.execute(insert(OutreachLog), log_rows)
     db.commit()
 
     return {
@@ -155,8 +160,11 @@ async def initiate_bulk_outreach(
         "results": results
     }
 
-@require_role([UserRole.ADMIN, UserRole.AGENT])
-@router.post("/leads/{lead_id}", response_model=Outreach)
+@router.post(
+    "/leads/{lead_id}",
+    response_model=Outreach,
+    dependencies=[Depends(require_role([UserRole.ADMIN, UserRole.AGENT]))]
+)
 async def trigger_outreach(
     lead_id: int,
     db: Session = Depends(get_db),
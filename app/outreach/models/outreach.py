@@ -1,13 +1,14 @@
 import enum
 import uuid
 
-from sqlalchemy import (JSON, Boolean, Column, DateTime, Enum, ForeignKey,
-                        Integer, String, Text)
+from sqlalchemy import (Boolean, Column, DateTime, ForeignKey,
+                        Index, Integer, String, Text)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.shared.db.base_class import BaseModel
+from app.shared.db.types import JSONType, StringEnum
 from sqlalchemy import func
 from sqlalchemy import func
 
@@ -44,12 +45,12 @@ class Outreach(BaseModel):
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.id", ondelete="CASCADE"), nullable=False)
     customer_id = Column(UUID(as_uuid=True), ForeignKey("customers.id", ondelete="CASCADE"), nullable=False)
-    channel = Column(Enum(OutreachChannel), nullable=False)
+    channel = Column(StringEnum(OutreachChannel), nullable=False)
     message = Column(Text, nullable=False)
     subject = Column(String(200))
     template_id = Column(String(100))
-    variables = Column(JSON)
-    status = Column(Enum(OutreachStatus), nullable=False, default=OutreachStatus.PENDING)
+    variables = Column(JSONType)
+    status = Column(StringEnum(OutreachStatus), nullable=False, default=OutreachStatus.PENDING)
     scheduled_at = Column(DateTime(timezone=True))
     sent_at = Column(DateTime(timezone=True))
     delivered_at = Column(DateTime(timezone=True))
@@ -75,10 +76,10 @@ class OutreachTemplate(BaseModel):
     customer_id = Column(UUID(as_uuid=True), ForeignKey("customers.id", ondelete="CASCADE"), nullable=False)
     name = Column(String(100), nullable=False)
     description = Column(String(500))
-    channel = Column(Enum(OutreachChannel), nullable=False)
+    channel = Column(StringEnum(OutreachChannel), nullable=False)
     subject = Column(String(200))
     body = Column(Text, nullable=False)
-    variables = Column(JSON)
+    variables = Column(JSONType)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
@@ -92,12 +93,18 @@ class OutreachTemplate(BaseModel):
 class OutreachLog(BaseModel):
     """Model for logging outreach activities."""
     __tablename__ = "outreach_logs"
+    __table_args__ = (
+        # Per-customer outreach stats: status counts over a created_at range
+        Index("ix_outreach_logs_customer_status_created", "customer_id", "status", "created_at"),
+        # A lead's outreach log, newest first
+        Index("ix_outreach_logs_lead_created", "lead_id", "created_at"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     lead_id = Column(UUID(as_uuid=True), ForeignKey("leads.id", ondelete="CASCADE"), nullable=False)
     customer_id = Column(UUID(as_uuid=True), ForeignKey("customers.id", ondelete="CASCADE"), nullable=False)
-    channel = Column(Enum(OutreachChannel), nullable=False)
-    status = Column(Enum(OutreachStatus), default=OutreachStatus.PENDING)
+    channel = Column(StringEnum(OutreachChannel), nullable=False)
+    status = Column(StringEnum(OutreachStatus), default=OutreachStatus.PENDING)
     message = Column(Text, nullable=False)
     sent_at = Column(DateTime(timezone=True))
     error_message = Column(Text)
@@ -119,7 +126,7 @@ class CommunicationPreference(BaseModel):
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     customer_id = Column(UUID(as_uuid=True), ForeignKey("customers.id", ondelete="CASCADE"), nullable=False)
-    default_channel = Column(Enum(OutreachChannel), nullable=False)
+    default_channel = Column(StringEnum(OutreachChannel), nullable=False)
     email_template = Column(String(100))
     sms_template = Column(String(100))
     whatsapp_template = Column(String(100))
@@ -143,15 +150,15 @@ class OutreachCampaign(BaseModel):
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="SET NULL"), nullable=True)
     name = Column(String(100), nullable=False)
     description = Column(Text)
-    channel = Column(Enum(OutreachChannel), nullable=False)
-    status = Column(Enum(CampaignStatus), default=CampaignStatus.DRAFT, nullable=False)
+    channel = Column(StringEnum(OutreachChannel), nullable=False)
+    status = Column(StringEnum(CampaignStatus), default=CampaignStatus.DRAFT, nullable=False)
     scheduled_at = Column(DateTime(timezone=True))
     started_at = Column(DateTime(timezone=True))
     completed_at = Column(DateTime(timezone=True))
     total_recipients = Column(Integer, default=0)
     successful_deliveries = Column(Integer, default=0)
     failed_deliveries = Column(Integer, default=0)
-    campaign_metadata = Column(JSON)
+    campaign_metadata = Column(JSONType)
     created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
     updated_at = Column(DateTime(timezone=True), onupdate=func.now(), nullable=True)
 
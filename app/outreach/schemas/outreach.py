@@ -1,5 +1,4 @@
 from datetime import datetime
-from enum import Enum
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
@@ -8,22 +7,6 @@ from pydantic import BaseModel, EmailStr, Field, validator
 from app.outreach.models.outreach import OutreachChannel, OutreachStatus
 
 
-class OutreachChannel(str, Enum):
-    EMAIL = "email"
-    SMS = "sms"
-    CALL = "call"
-    WHATSAPP = "whatsapp"
-
-class OutreachStatus(str, Enum):
-    SCHEDULED = "scheduled"
-    SENT = "sent"
-    DELIVERED = "delivered"
-    READ = "read"
-    FAILED = "failed"
-    CANCELLED = "cancelled"
-    PENDING = "pending"
-    RESPONDED = "responded"
-
 # --- Base Schemas ---
 class OutreachBase(BaseModel):
     """Base fields required for all outreach operations."""
@@ -1,13 +1,14 @@
 import enum
 import uuid
 
-from sqlalchemy import (JSON, Boolean, Column, DateTime, Enum, Float,
-                        ForeignKey, Integer, String, Table, Text)
+from sqlalchemy import (Boolean, Column, DateTime, Enum, Float,
+                        ForeignKey, Index, Integer, String, Table, Text)
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 from app.shared.db.base_class import BaseModel
+from app.shared.db.types import JSONType
 from app.shared.models.user import User
 from app.shared.models.associations import project_leads
 
@@ -27,7 +28,10 @@ class ProjectStatus(str, enum.Enum):
 
 class Project(BaseModel):
     __tablename__ = "projects"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # Serves the amenities filter in project listings (jsonb ?| operator)
+        Index("ix_projects_amenities_gin", "amenities", postgresql_using="gin"),
+    )
     
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     name = Column(String(100), nullable=False)
@@ -37,13 +41,13 @@ class Project(BaseModel):
     location = Column(String(200), nullable=False)
     total_units = Column(Integer)
     price_range = Column(String(100))
-    amenities = Column(JSON)
+    amenities = Column(JSONType)
     completion_date = Column(DateTime)
     total_value = Column(Float, default=0.0)
     start_date = Column(DateTime)
     end_date = Column(DateTime)
     budget = Column(Float)
-    model_metadata = Column(JSON)  # Additional project metadata
+    model_metadata = Column(JSONType)  # Additional project metadata
     
     # Location fields
     address = Column(String(200), nullable=False)
@@ -66,10 +70,11 @@ class Project(BaseModel):
     
     # Relationships
     customer = relationship("Customer", back_populates="projects")
-    leads = relationship("Lead", secondary=project_leads, back_populates="projects")
-    features = relationship("ProjectFeature", back_populates="project", cascade="all, delete-orphan")
-    images = relationship("ProjectImage", back_populates="project", cascade="all, delete-orphan")
-    amenities_list = relationship("ProjectAmenity", back_populates="project", cascade="all, delete-orphan")
+    # Unbounded; read through project.leads.select() so callers can page it
+    leads = relationship("Lead", secondary=project_leads, back_populates="projects", lazy="write_only")
+    features = relationship("ProjectFeature", back_populates="project", cascade="all, delete-orphan", lazy="selectin")
+    images = relationship("ProjectImage", back_populates="project", cascade="all, delete-orphan", lazy="selectin")
+    amenities_list = relationship("ProjectAmenity", back_populates="project", cascade="all, delete-orphan", lazy="selectin")
     created_by_user = relationship("User", back_populates="created_projects", foreign_keys=[created_by_id])
     updated_by_user = relationship("User", back_populates="updated_projects", foreign_keys=[updated_by_id])
     assigned_to = relationship("User", back_populates="assigned_projects", foreign_keys=[assigned_to_id])
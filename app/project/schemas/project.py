@@ -162,7 +162,6 @@ class Project(ProjectBase):
     features: List[ProjectFeature] = []
     images: List[ProjectImage] = []
     amenities_list: List[ProjectAmenity] = []
-    leads: List[UUID] = []  # List of lead IDs instead of ProjectLead objects
 
     class Config:
         from_attributes = True
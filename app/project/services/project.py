@@ -3,8 +3,9 @@ from datetime import datetime, timedelta
 from typing import Any, Dict, List, Tuple
 from uuid import UUID
 
-from sqlalchemy import and_, func
-from sqlalchemy.orm import Session
+from sqlalchemy import Text, and_, cast, func, type_coerce
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.orm import Session, selectinload
 
 from app.project.models.project import (
     Project,
@@ -28,6 +29,7 @@ from app.project.schemas.project import (
 from app.shared.core.audit import AuditService
 from app.shared.core.exceptions import NotFoundException, ValidationError, ValidationException
 from app.shared.core.pagination import PaginationParams
+from app.shared.db.loading import explicit_loading
 from app.shared.services.ai import AIService
 from app.shared.core.logging import logger
 
@@ -62,13 +64,20 @@ class ProjectService:
         if filter_params.max_price:
             query = query.filter(Project.total_value <= filter_params.max_price)
         if filter_params.amenities:
-            query = query.filter(Project.amenities.overlap(filter_params.amenities))
+            # Any of the requested amenities; uses the GIN index on amenities
+            query = query.filter(
+                type_coerce(Project.amenities, JSONB).has_any(cast(filter_params.amenities, ARRAY(Text)))
+            )
 
         # Get total count before pagination
         total_count = query.count()
 
-        # Apply pagination
-        query = query.offset(pagination.offset).limit(pagination.limit)
+        # Apply pagination, loading exactly the collections the response renders
+        query = query.options(*explicit_loading(
+            selectinload(Project.features),
+            selectinload(Project.images),
+            selectinload(Project.amenities_list)
+        )).offset(pagination.offset).limit(pagination.limit)
 
         return query.all(), total_count
 
@@ -185,9 +185,11 @@ class Settings(BaseSettings):
     DB_POOL_TIMEOUT: int = 30
     DB_POOL_RECYCLE: int = 1800
     DB_ECHO: bool = False
+    DB_QUERY_CACHE_SIZE: int = 1200  # compiled statement shapes kept per engine
 
     # ElevenLabs TTS Settings
     ELEVENLABS_API_KEY: str
+    ELEVENLABS_API_URL: str = "https://api.elevenlabs.io/v1"
     ELEVENLABS_MODEL_ID: str = "eleven_multilingual_v2"
     ELEVENLABS_OUTPUT_FORMAT: str = "mp3_44100_128"
     ELEVENLABS_AUDIO_CACHE_DIR: str = "static/audio"
@@ -222,6 +224,7 @@ class Settings(BaseSettings):
             "pool_timeout": self.DB_POOL_TIMEOUT,
             "pool_recycle": self.DB_POOL_RECYCLE,
             "echo": self.DB_ECHO,
+            "query_cache_size": self.DB_QUERY_CACHE_SIZE,
         }
 
     @property
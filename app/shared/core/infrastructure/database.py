@@ -1,40 +1,10 @@
 """
 Database session management.
-"""
-
-from typing import Generator
-
-from sqlalchemy import create_engine
-from sqlalchemy.orm import Session, sessionmaker
 
-from app.shared.core.config import settings
-from sqlalchemy.orm import Session
-from app.shared.db.session import get_db
-from sqlalchemy.orm import Session
-from app.shared.db.session import get_db
-
-# Create SQLAlchemy engine
-engine = create_engine(
-    settings.SQLALCHEMY_DATABASE_URI,
-    pool_pre_ping=True,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW
-)
-
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+The engine and session factory live in app.shared.db.session; they are
+re-exported here so every import path shares one connection pool.
+"""
 
-def get_db() -> Generator[Session, None, None]:
-    """
-    Get database session.
-    
-    Yields:
-        Session: Database session
-    """
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
+from app.shared.db.session import SessionLocal, engine, get_db
 
-__all__ = ["get_db", "SessionLocal"] 
\ No newline at end of file
+__all__ = ["get_db", "SessionLocal"]
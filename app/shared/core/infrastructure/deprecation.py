@@ -25,6 +25,7 @@ Usage:
     )
 """
 
+import inspect
 import warnings
 from functools import wraps
 from typing import Any, Callable, Optional
@@ -59,21 +60,26 @@ def deprecated(
             pass
     """
     def decorator(func: Callable) -> Callable:
+        # Everything about the wrapper is known at decoration time, so build
+        # the message and pick a sync/async wrapper once instead of per call.
+        warning_msg = f"Function {func.__name__} is deprecated"
+        if since:
+            warning_msg += f" since version {since}"
+        if replacement:
+            warning_msg += f". Use {replacement} instead."
+        if message:
+            warning_msg += f" {message}"
+
+        if inspect.iscoroutinefunction(func):
+            @wraps(func)
+            async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+                warnings.warn(warning_msg, DeprecationWarning, stacklevel=2)
+                return await func(*args, **kwargs)
+            return async_wrapper
+
         @wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> Any:
-            warning_msg = f"Function {func.__name__} is deprecated"
-            if since:
-                warning_msg += f" since version {since}"
-            if replacement:
-                warning_msg += f". Use {replacement} instead."
-            if message:
-                warning_msg += f" {message}"
-            
-            warnings.warn(
-                warning_msg,
-                DeprecationWarning,
-                stacklevel=2
-            )
+            warnings.warn(warning_msg, DeprecationWarning, stacklevel=2)
             return func(*args, **kwargs)
         return wrapper
     return decorator
@@ -1,24 +1,81 @@
+import asyncio
 import logging
-from datetime import datetime, timedelta
-from typing import Dict, Tuple
-from datetime import datetime
-from typing import Dict
-from app.shared.core.logging import logger
-from datetime import timedelta
-from datetime import datetime
-from typing import Dict
-from app.shared.core.logging import logger
-from datetime import timedelta
+import threading
+import time
+import uuid
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Deque, Optional, Tuple
+
+try:
+    from redis import asyncio as redis_asyncio
+    from redis.exceptions import RedisError
+    HAS_REDIS = True
+except ImportError:
+    HAS_REDIS = False
 
 logger = logging.getLogger(__name__)
 
+# Clients tracked before idle ones are evicted
+MAX_TRACKED_CLIENTS = 10_000
+# Lock stripes guarding per-client windows (power of two)
+LOCK_STRIPES = 64
+# Redis connect/read timeouts (seconds); a stalled Redis falls back to the
+# local limiter instead of holding every request for the OS TCP timeout
+REDIS_CONNECT_TIMEOUT = 0.25
+REDIS_SOCKET_TIMEOUT = 0.25
+
 class RateLimiter:
-    """Rate limiter for API endpoints."""
+    """
+    Sliding-window rate limiter for API endpoints.
+    
+    Each client's request times are kept oldest-first in a deque, so expired
+    entries are dropped from the left in amortized O(1). Clients are kept in
+    least-recently-seen order; past max_clients, clients with no request left
+    in the window are evicted.
+    
+    Safe to share between threads: a client's check-and-record runs under one
+    of LOCK_STRIPES locks picked by client hash, and the client map under a
+    separate short-lived lock.
+    """
     
-    def __init__(self, max_requests: int, window_seconds: int):
+    def __init__(self, max_requests: int, window_seconds: int, max_clients: int = MAX_TRACKED_CLIENTS):
         self.max_requests = max_requests
         self.window_seconds = window_seconds
-        self.requests: Dict[str, list] = {}
+        self.max_clients = max_clients
+        self.requests: "OrderedDict[str, Deque[float]]" = OrderedDict()
+        self._clients_lock = threading.Lock()
+        self._locks = [threading.Lock() for _ in range(LOCK_STRIPES)]
+    
+    def _prune(self, window: Deque[float], now: float) -> None:
+        """Drop request times that have left the window."""
+        cutoff = now - self.window_seconds
+        while window and window[0] <= cutoff:
+            window.popleft()
+    
+    def _lock_for(self, client_id: str) -> threading.Lock:
+        """Return the lock stripe guarding a client's window."""
+        return self._locks[hash(client_id) & (LOCK_STRIPES - 1)]
+    
+    def _evict_idle(self, now: float) -> None:
+        """Evict least-recently-seen clients whose windows have emptied."""
+        cutoff = now - self.window_seconds
+        while len(self.requests) > self.max_clients:
+            client_id, window = next(iter(self.requests.items()))
+            if window and window[-1] > cutoff:
+                break  # Least-recently-seen client is still active; stop scanning
+            del self.requests[client_id]
+    
+    def _window_for(self, client_id: str) -> Deque[float]:
+        """Return the client's window, registering the client if new."""
+        with self._clients_lock:
+            window = self.requests.get(client_id)
+            if window is None:
+                window = self.requests[client_id] = deque(maxlen=self.max_requests)
+                self._evict_idle(time.monotonic())
+            else:
+                self.requests.move_to_end(client_id)
+            return window
     
     def check_rate_limit(self, client_id: str) -> bool:
         """
@@ -30,35 +87,30 @@ class RateLimiter:
         Returns:
             True if request is allowed, False if rate limit exceeded
         """
-        now = datetime.utcnow()
-        window_start = now - timedelta(seconds=self.window_seconds)
-        
-        # Initialize or clean up old requests
-        if client_id not in self.requests:
-            self.requests[client_id] = []
+        window = self._window_for(client_id)
         
-        # Remove requests outside the window
-        self.requests[client_id] = [
-            req_time for req_time in self.requests[client_id]
-            if req_time > window_start
-        ]
+        with self._lock_for(client_id):
+            now = time.monotonic()
+            self._prune(window, now)
+            in_window = len(window)
+            allowed = in_window < self.max_requests
+            if allowed:
+                # Add new request
+                window.append(now)
         
         # Check if rate limit is exceeded
-        if len(self.requests[client_id]) >= self.max_requests:
+        if not allowed:
             logger.warning(
-                f"Rate limit exceeded for client {client_id}",
+                "Rate limit exceeded for client %s",
+                client_id,
                 extra={
                     "client_id": client_id,
-                    "requests_in_window": len(self.requests[client_id]),
+                    "requests_in_window": in_window,
                     "max_requests": self.max_requests,
                     "window_seconds": self.window_seconds
                 }
             )
-            return False
-        
-        # Add new request
-        self.requests[client_id].append(now)
-        return True
+        return allowed
     
     def get_remaining_requests(self, client_id: str) -> Tuple[int, int]:
         """
@@ -70,24 +122,168 @@ class RateLimiter:
         Returns:
             Tuple of (remaining_requests, seconds_until_reset)
         """
-        now = datetime.utcnow()
-        window_start = now - timedelta(seconds=self.window_seconds)
-        
-        if client_id not in self.requests:
+        window = self.requests.get(client_id)
+        if window is None:
             return self.max_requests, 0
         
-        # Remove old requests
-        self.requests[client_id] = [
-            req_time for req_time in self.requests[client_id]
-            if req_time > window_start
-        ]
+        with self._lock_for(client_id):
+            # Remove old requests
+            now = time.monotonic()
+            self._prune(window, now)
+            
+            remaining = self.max_requests - len(window)
+            reset_seconds = 0
+            
+            if window:
+                reset_seconds = max(0, int(window[0] + self.window_seconds - now))
+        
+        return remaining, reset_seconds
+
+# Sliding-window log on a sorted set, run atomically on the server:
+# drop expired members, count, and record the request only if under the
+# limit. Scores are server time (ms), so every worker shares one clock.
+# KEYS[1] = window key; ARGV = window_ms, max_requests, unique member
+_SLIDING_WINDOW_SCRIPT = """
+local t = redis.call('TIME')
+local now = t[1] * 1000 + math.floor(t[2] / 1000)
+local window = tonumber(ARGV[1])
+redis.call('ZREMRANGEBYSCORE', KEYS[1], '-inf', now - window)
+if redis.call('ZCARD', KEYS[1]) >= tonumber(ARGV[2]) then
+    return 0
+end
+redis.call('ZADD', KEYS[1], now, ARGV[3])
+redis.call('PEXPIRE', KEYS[1], window)
+return 1
+"""
+
+@lru_cache(maxsize=None)
+def _get_redis_client(redis_url: str) -> "redis_asyncio.Redis":
+    """Return the shared Redis client (and connection pool) for a URL."""
+    return redis_asyncio.from_url(
+        redis_url,
+        socket_connect_timeout=REDIS_CONNECT_TIMEOUT,
+        socket_timeout=REDIS_SOCKET_TIMEOUT
+    )
+
+class RedisRateLimiter:
+    """
+    Sliding-window rate limiter shared by every worker through Redis.
+    
+    RateLimiter only sees one process, so N workers would each allow
+    max_requests. Here the check-and-record is a single Lua script, and
+    window keys expire on their own once a client goes idle. If Redis is
+    unreachable, requests are checked by a per-process RateLimiter instead.
+    """
+    
+    def __init__(self, redis_client: "redis_asyncio.Redis", max_requests: int, window_seconds: int, key_prefix: str = "rate_limit"):
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.key_prefix = key_prefix
+        # Runs via EVALSHA, loading the script on first NOSCRIPT
+        self._script = redis_client.register_script(_SLIDING_WINDOW_SCRIPT)
+        self._fallback = RateLimiter(max_requests, window_seconds)
+    
+    async def check_rate_limit(self, client_id: str) -> bool:
+        """
+        Check if a client has exceeded their rate limit.
+        
+        Args:
+            client_id: Client identifier (e.g., IP address)
+            
+        Returns:
+            True if request is allowed, False if rate limit exceeded
+        """
+        try:
+            allowed = await self._script(
+                keys=[f"{self.key_prefix}:{client_id}"],
+                args=[self.window_seconds * 1000, self.max_requests, uuid.uuid4().hex]
+            )
+        except RedisError as e:
+            logger.warning("Redis rate limiting unavailable, using local limiter: %s", e)
+            return self._fallback.check_rate_limit(client_id)
         
-        remaining = self.max_requests - len(self.requests[client_id])
-        reset_seconds = 0
+        if not allowed:
+            logger.warning(
+                "Rate limit exceeded for client %s",
+                client_id,
+                extra={
+                    "client_id": client_id,
+                    "max_requests": self.max_requests,
+                    "window_seconds": self.window_seconds
+                }
+            )
+        return bool(allowed)
+
+def create_redis_rate_limiter(
+    redis_url: Optional[str],
+    max_requests: int,
+    window_seconds: int,
+    key_prefix: str = "rate_limit"
+) -> Optional[RedisRateLimiter]:
+    """
+    Create a Redis-backed limiter.
+    
+    Returns:
+        The limiter, or None when no Redis URL is configured or the redis
+        package is not installed
+    """
+    if not redis_url or not HAS_REDIS:
+        return None
+    return RedisRateLimiter(_get_redis_client(redis_url), max_requests, window_seconds, key_prefix)
+
+class AsyncTokenBucket:
+    """
+    Token-bucket rate limiter for async callers.
+    
+    Unlike RateLimiter, which rejects requests over the limit, acquire()
+    waits until enough tokens have refilled, so throttled callers yield
+    to the event loop instead of failing or blocking it. Tokens are shared
+    process-wide; the lock serializing waiters is bound to each event loop.
+    """
+    
+    def __init__(self, capacity: int, refill_rate: float):
+        """
+        Args:
+            capacity: Maximum burst size in tokens
+            refill_rate: Tokens added per second
+        """
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = float(capacity)
+        self.last = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+        self._lock_loop: Optional[asyncio.AbstractEventLoop] = None
+    
+    def _get_lock(self) -> asyncio.Lock:
+        """Return the waiters' lock for the running loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._lock_loop is not loop:
+            self._lock = asyncio.Lock()
+            self._lock_loop = loop
+        return self._lock
+    
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(self.capacity, self.tokens + (now - self.last) * self.refill_rate)
+        self.last = now
+    
+    async def acquire(self, cost: float = 1) -> None:
+        """
+        Wait until `cost` tokens are available and consume them.
         
-        if self.requests[client_id]:
-            oldest_request = min(self.requests[client_id])
-            reset_time = oldest_request + timedelta(seconds=self.window_seconds)
-            reset_seconds = max(0, int((reset_time - now).total_seconds()))
+        Args:
+            cost: Number of tokens to consume
+            
+        Raises:
+            ValueError: If cost exceeds the bucket capacity, since it could
+                never be satisfied
+        """
+        if cost > self.capacity:
+            raise ValueError(f"Cost {cost} exceeds bucket capacity {self.capacity}")
         
-        return remaining, reset_seconds 
\ No newline at end of file
+        async with self._get_lock():
+            self._refill()
+            while self.tokens < cost:
+                await asyncio.sleep((cost - self.tokens) / self.refill_rate)
+                self._refill()
+            self.tokens -= cost
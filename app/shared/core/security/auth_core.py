@@ -8,12 +8,11 @@ import re
 
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 
 from app.shared.core.config import settings
 from app.shared.core.exceptions import AuthenticationException, ValidationError
+from app.shared.core.security.password_utils import get_password_hash, verify_password
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 def validate_subject(subject: str) -> None:
@@ -109,18 +108,6 @@ def create_refresh_token(
     )
     return encoded_jwt
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """
-    Verify a password against a hash.
-    """
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    """
-    Hash a password.
-    """
-    return pwd_context.hash(password)
-
 def decode_token(token: str) -> dict:
     """
     Decode a JWT token.
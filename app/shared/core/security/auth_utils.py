@@ -7,7 +7,6 @@ from typing import Any, Optional
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
-from passlib.context import CryptContext
 from sqlalchemy.orm import Session
 
 from app.shared.core.config import settings
@@ -29,7 +28,6 @@ from app.shared.db.session import get_db
 from fastapi import HTTPException
 from typing import Any
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 async def get_current_user(
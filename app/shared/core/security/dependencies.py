@@ -2,7 +2,8 @@
 Security dependencies for FastAPI endpoints.
 """
 
-from typing import List, TYPE_CHECKING
+from functools import lru_cache
+from typing import FrozenSet, List, TYPE_CHECKING
 from fastapi import Depends, HTTPException, status
 from sqlalchemy.orm import Session
 
@@ -17,6 +18,11 @@ from app.shared.core.security.auth import (
 if TYPE_CHECKING:
     from app.shared.models.user import User
 
+# Plain string role values, resolved once so checks skip enum attribute access
+_ADMIN_ROLE = Role.ADMIN.value
+_CUSTOMER_ROLE = Role.CUSTOMER.value
+_AGENT_ROLES = frozenset((Role.AGENT.value, Role.ADMIN.value))
+
 def require_role(allowed_roles: List[Role]):
     """
     Dependency to require specific roles.
@@ -25,10 +31,17 @@ def require_role(allowed_roles: List[Role]):
         allowed_roles: List of roles that are allowed to access the endpoint
         
     Returns:
-        A dependency function that checks if the current user has one of the allowed roles
+        A dependency function that checks if the current user has one of the allowed roles.
+        The same role set always yields the same function, so routes share it and
+        FastAPI's per-request dependency cache can reuse its result.
     """
+    return _role_dependency(frozenset(role.value for role in allowed_roles))
+
+@lru_cache(maxsize=None)
+def _role_dependency(allowed: FrozenSet[str]):
+    """Build the role-check dependency for one set of role values."""
     async def dependency(current_user: "User" = Depends(get_current_user)):
-        if current_user.role not in [role.value for role in allowed_roles]:
+        if current_user.role not in allowed:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
                 detail="Not enough permissions"
@@ -49,7 +62,7 @@ async def admin_required(current_user=Depends(get_current_user)):
     Raises:
         HTTPException: If user is not an admin
     """
-    if current_user.role != Role.ADMIN.value:
+    if current_user.role != _ADMIN_ROLE:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
@@ -69,7 +82,7 @@ async def agent_required(current_user=Depends(get_current_user)):
     Raises:
         HTTPException: If user is not an agent or admin
     """
-    if current_user.role not in [Role.AGENT.value, Role.ADMIN.value]:
+    if current_user.role not in _AGENT_ROLES:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
@@ -89,7 +102,7 @@ async def customer_required(current_user=Depends(get_current_user)):
     Raises:
         HTTPException: If user is not a customer
     """
-    if current_user.role != Role.CUSTOMER.value:
+    if current_user.role != _CUSTOMER_ROLE:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions"
@@ -1,4 +1,5 @@
 import base64
+from functools import lru_cache
 from typing import Union
 
 from cryptography.fernet import Fernet
@@ -7,6 +8,11 @@ from sqlalchemy.types import String, TypeDecorator
 from app.shared.core.config import settings
 
 
+@lru_cache(maxsize=1)
+def _get_fernet() -> Fernet:
+    """Return the shared Fernet instance for settings.ENCRYPTION_KEY."""
+    return Fernet(settings.ENCRYPTION_KEY.encode())
+
 class EncryptedField(TypeDecorator):
     """SQLAlchemy type for encrypted fields"""
     impl = String
@@ -14,7 +20,7 @@ class EncryptedField(TypeDecorator):
 
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        self._fernet = Fernet(settings.ENCRYPTION_KEY.encode())
+        self._fernet = _get_fernet()
 
     def process_bind_param(self, value, dialect):
         if value is not None:
@@ -32,15 +38,13 @@ def encrypt_value(value: str) -> str:
     """Encrypt a string value"""
     if not value:
         return value
-    fernet = Fernet(settings.ENCRYPTION_KEY.encode())
-    return fernet.encrypt(value.encode()).decode()
+    return _get_fernet().encrypt(value.encode()).decode()
 
 def decrypt_value(value: str) -> str:
     """Decrypt a string value"""
     if not value:
         return value
-    fernet = Fernet(settings.ENCRYPTION_KEY.encode())
-    return fernet.decrypt(value.encode()).decode()
+    return _get_fernet().decrypt(value.encode()).decode()
 
 class EncryptionService:
     def __init__(self):
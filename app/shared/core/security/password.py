@@ -1,12 +1,3 @@
-from passlib.context import CryptContext
+from app.shared.core.security.password_utils import get_password_hash, verify_password
 
-# Create a password context
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
-
-def get_password_hash(password: str) -> str:
-    """Generate a password hash."""
-    return pwd_context.hash(password) 
\ No newline at end of file
+__all__ = ["get_password_hash", "verify_password"]
@@ -1,15 +1,19 @@
-from passlib.context import CryptContext
+from functools import lru_cache
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+@lru_cache(maxsize=1)
+def _get_pwd_context():
+    """Build the bcrypt context on first use so passlib loads lazily."""
+    from passlib.context import CryptContext
+    return CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """
     Verify a password against a hash.
     """
-    return pwd_context.verify(plain_password, hashed_password)
+    return _get_pwd_context().verify(plain_password, hashed_password)
 
 def get_password_hash(password: str) -> str:
     """
     Hash a password.
     """
-    return pwd_context.hash(password) 
\ No newline at end of file
+    return _get_pwd_context().hash(password) 
\ No newline at end of file
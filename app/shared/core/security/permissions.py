@@ -3,11 +3,12 @@ Permission management module.
 """
 
 from enum import Enum
-from typing import Dict, Set, TYPE_CHECKING
+from typing import Dict, Iterable, Set, TYPE_CHECKING
 
-from fastapi import HTTPException, status
+from fastapi import Depends, HTTPException, status
 
 from app.shared.core.exceptions import PermissionDenied
+from app.shared.core.security.auth import get_current_user
 from app.shared.core.security.role_types import Role
 
 if TYPE_CHECKING:
@@ -70,6 +71,27 @@ ROLE_PERMISSIONS: Dict[Role, Set[Permission]] = {
     },
 }
 
+# Bitmask view of ROLE_PERMISSIONS: each permission owns one bit, so a
+# permission check is a single AND against the role's mask.
+PERMISSION_BITS: Dict[Permission, int] = {
+    permission: 1 << index for index, permission in enumerate(Permission)
+}
+
+def permission_mask(permissions: Iterable[Permission]) -> int:
+    """Pack a collection of permissions into a bitmask."""
+    mask = 0
+    for permission in permissions:
+        mask |= PERMISSION_BITS.get(permission, 0)
+    return mask
+
+ROLE_PERMISSION_MASKS: Dict[Role, int] = {
+    role: permission_mask(permissions)
+    for role, permissions in ROLE_PERMISSIONS.items()
+}
+
+def _role_has_permission(role: Role, permission_bit: int) -> bool:
+    return bool(ROLE_PERMISSION_MASKS.get(role, 0) & permission_bit)
+
 def get_user_permissions(user: "User") -> Set[Permission]:
     """Get all permissions for a user."""
     return ROLE_PERMISSIONS.get(user.role, set())
@@ -88,8 +110,9 @@ def check_permission(
     if current_user.is_superuser:
         return True
         
-    user_permissions = get_user_permissions(current_user)
-    return required_permission in user_permissions
+    return _role_has_permission(
+        current_user.role, PERMISSION_BITS.get(required_permission, 0)
+    )
 
 def has_permission(
     required_permission: str,
@@ -102,8 +125,9 @@ def has_permission(
     if current_user.is_superuser:
         return True
         
-    user_permissions = get_user_permissions(current_user)
-    return required_permission in user_permissions
+    return _role_has_permission(
+        current_user.role, PERMISSION_BITS.get(required_permission, 0)
+    )
 
 class PermissionService:
     """Service for managing permissions and role-based access control."""
@@ -116,13 +140,15 @@ class PermissionService:
     @staticmethod
     def has_permission(role: Role, permission: Permission) -> bool:
         """Check if a role has a specific permission."""
-        return permission in ROLE_PERMISSIONS.get(role, set())
+        return _role_has_permission(role, PERMISSION_BITS.get(permission, 0))
     
     @staticmethod
     def require_permission(permission: Permission):
         """Dependency for requiring a specific permission."""
-        def dependency(current_user: "User"):
-            if not PermissionService.has_permission(current_user.role, permission):
+        required_bit = PERMISSION_BITS.get(permission, 0)
+
+        def dependency(current_user: "User" = Depends(get_current_user)):
+            if not _role_has_permission(current_user.role, required_bit):
                 raise PermissionDenied(
                     detail=f"Required permission: {permission}"
                 )
@@ -132,11 +158,12 @@ class PermissionService:
     @staticmethod
     def require_roles(*roles: Role):
         """Dependency for requiring specific roles."""
-        def dependency(current_user: "User"):
-            if current_user.role not in roles:
-                raise PermissionDenied(
-                    detail=f"Required roles: {', '.join(role.value for role in roles)}"
-                )
+        allowed = frozenset(role.value for role in roles)
+        detail = f"Required roles: {', '.join(role.value for role in roles)}"
+
+        def dependency(current_user: "User" = Depends(get_current_user)):
+            if current_user.role not in allowed:
+                raise PermissionDenied(detail=detail)
             return current_user
         return dependency
 
@@ -156,6 +183,9 @@ require_system_management = permission_service.require_permission(Permission.MAN
 
 __all__ = [
     'Permission',
+    'PERMISSION_BITS',
+    'ROLE_PERMISSION_MASKS',
+    'permission_mask',
     'PermissionService',
     'permission_service',
     'require_admin',
@@ -5,61 +5,34 @@ This module implements a role-based access control system for the Real Estate AI
 It defines permissions, roles, and provides utilities for permission checking and role-based access control.
 
 Key Components:
-- Permission: Enum defining all system permissions
+- Permission: Enum defining all system permissions (shared with the permissions module)
 - ROLE_PERMISSIONS: Mapping of roles to their allowed permissions
 - PermissionService: Service class for managing permissions and RBAC
 
 Usage:
     from app.shared.core.security.rbac import require_admin, require_agent
 
-    @router.get("/admin-only")
-    @require_admin
+    @router.get("/admin-only", dependencies=[Depends(require_admin)])
     async def admin_only_endpoint():
         return {"message": "Admin access granted"}
 """
 
-from enum import Enum
 from typing import Dict, List, TYPE_CHECKING
 
+from fastapi import Depends
+
 from app.shared.core.exceptions import PermissionDenied
-from app.shared.core.security.permissions import Permission
+from app.shared.core.security.auth import get_current_user
+from app.shared.core.security.permissions import (
+    PERMISSION_BITS,
+    Permission,
+    permission_mask
+)
 from app.shared.core.security.roles import Role
 
 if TYPE_CHECKING:
     from app.shared.models.user import User
 
-class Permission(str, Enum):
-    """
-    System permissions enum.
-    
-    This enum defines all possible permissions in the system, organized by category:
-    - User Management: Permissions for managing users
-    - Property Management: Permissions for managing properties
-    - Customer Management: Permissions for managing customers
-    - System Management: Permissions for system-level operations
-    """
-    # User Management
-    CREATE_USER = "create_user"
-    READ_USER = "read_user"
-    UPDATE_USER = "update_user"
-    DELETE_USER = "delete_user"
-    
-    # Property Management
-    CREATE_PROPERTY = "create_property"
-    READ_PROPERTY = "read_property"
-    UPDATE_PROPERTY = "update_property"
-    DELETE_PROPERTY = "delete_property"
-    
-    # Customer Management
-    CREATE_CUSTOMER = "create_customer"
-    READ_CUSTOMER = "read_customer"
-    UPDATE_CUSTOMER = "update_customer"
-    DELETE_CUSTOMER = "delete_customer"
-    
-    # System Management
-    MANAGE_SYSTEM = "manage_system"
-    VIEW_AUDIT_LOGS = "view_audit_logs"
-
 # Role-Permission mapping
 ROLE_PERMISSIONS: Dict[Role, List[Permission]] = {
     Role.ADMIN: [
@@ -104,6 +77,11 @@ The permissions are organized in a hierarchical structure where:
 - GUEST has minimal read-only permissions
 """
 
+ROLE_PERMISSION_MASKS: Dict[Role, int] = {
+    role: permission_mask(permissions)
+    for role, permissions in ROLE_PERMISSIONS.items()
+}
+
 class RBACService:
     """Service for role-based access control."""
     
@@ -115,13 +93,17 @@ class RBACService:
     @staticmethod
     def has_permission(role: Role, permission: Permission) -> bool:
         """Check if a role has a specific permission."""
-        return permission in ROLE_PERMISSIONS.get(role, [])
+        return bool(
+            ROLE_PERMISSION_MASKS.get(role, 0) & PERMISSION_BITS.get(permission, 0)
+        )
     
     @staticmethod
     def require_permission(permission: Permission):
         """Dependency for requiring a specific permission."""
-        def dependency(current_user: "User"):
-            if not RBACService.has_permission(current_user.role, permission):
+        required_bit = PERMISSION_BITS.get(permission, 0)
+
+        def dependency(current_user: "User" = Depends(get_current_user)):
+            if not ROLE_PERMISSION_MASKS.get(current_user.role, 0) & required_bit:
                 raise PermissionDenied(
                     detail=f"Required permission: {permission}"
                 )
@@ -131,11 +113,12 @@ class RBACService:
     @staticmethod
     def require_roles(*roles: Role):
         """Dependency for requiring specific roles."""
-        def dependency(current_user: "User"):
-            if current_user.role not in roles:
-                raise PermissionDenied(
-                    detail=f"Required roles: {', '.join(role.value for role in roles)}"
-                )
+        allowed = frozenset(role.value for role in roles)
+        detail = f"Required roles: {', '.join(role.value for role in roles)}"
+
+        def dependency(current_user: "User" = Depends(get_current_user)):
+            if current_user.role not in allowed:
+                raise PermissionDenied(detail=detail)
             return current_user
         return dependency
 
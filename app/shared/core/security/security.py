@@ -1,10 +1,10 @@
 import base64
 import hashlib
-
-import pyotp
-from cryptography.fernet import Fernet
-from passlib.context import CryptContext
-from sqlalchemy import func
+import hmac
+import os
+import struct
+import time
+from functools import lru_cache
 
 from app.shared.core.config import settings
 from app.shared.core.security.password_utils import get_password_hash, verify_password
@@ -13,35 +13,86 @@ from app.shared.core.security.password_utils import get_password_hash, verify_pa
 ACCESS_TOKEN_EXPIRE_MINUTES = settings.ACCESS_TOKEN_EXPIRE_MINUTES
 REFRESH_TOKEN_EXPIRE_DAYS = settings.REFRESH_TOKEN_EXPIRE_DAYS
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# TOTP parameters (RFC 6238 defaults, matching what pyotp provisions)
+TOTP_INTERVAL = 30
+TOTP_DIGITS = 6
+TOTP_VALID_WINDOW = 1
+_TOTP_MODULO = 10 ** TOTP_DIGITS
+_TOTP_COUNTER = struct.Struct(">Q")
+
+# Key material derived from SECRET_KEY once at import; every cipher below
+# (and any future signer) reuses it instead of re-hashing per call.
+_DERIVED_KEY = hashlib.sha256(settings.SECRET_KEY.encode()).digest()
+
+# AES-256-GCM cipher keyed from SECRET_KEY
+AES_NONCE_SIZE = 12
+AES_TAG_SIZE = 16
+
+# cryptography's CFFI bindings are only loaded the first time a value is
+# encrypted or decrypted, keeping them out of worker start-up.
+@lru_cache(maxsize=1)
+def _get_aesgcm():
+    from cryptography.hazmat.primitives.ciphers.aead import AESGCM
+    return AESGCM(_DERIVED_KEY)
+
+@lru_cache(maxsize=1)
+def _get_legacy_fernet():
+    from cryptography.fernet import Fernet
+    return Fernet(base64.urlsafe_b64encode(_DERIVED_KEY))
 
 def encrypt_value(value: str) -> str:
     """
-    Encrypt a value using Fernet symmetric encryption.
+    Encrypt a value using AES-GCM authenticated encryption.
     
     Args:
         value: The value to encrypt
         
     Returns:
-        str: The encrypted value as a base64 string
+        str: The nonce and ciphertext as a base64 string
     """
-    key = base64.urlsafe_b64encode(hashlib.sha256(settings.SECRET_KEY.encode()).digest())
-    f = Fernet(key)
-    return f.encrypt(value.encode()).decode()
+    nonce = os.urandom(AES_NONCE_SIZE)
+    ciphertext = _get_aesgcm().encrypt(nonce, value.encode(), None)
+    return base64.urlsafe_b64encode(nonce + ciphertext).decode()
 
 def decrypt_value(encrypted_value: str) -> str:
     """
     Decrypt a value that was encrypted using encrypt_value.
     
+    Values written by the previous Fernet-based implementation are still
+    accepted so existing data keeps decrypting.
+    
     Args:
         encrypted_value: The encrypted value as a base64 string
         
     Returns:
         str: The decrypted value
+        
+    Raises:
+        ValueError: If the value is not base64, was not encrypted with this
+            key, or has been tampered with
     """
-    key = base64.urlsafe_b64encode(hashlib.sha256(settings.SECRET_KEY.encode()).digest())
-    f = Fernet(key)
-    return f.decrypt(encrypted_value.encode()).decode()
+    from cryptography.exceptions import InvalidTag
+    from cryptography.fernet import InvalidToken
+
+    try:
+        data = base64.urlsafe_b64decode(encrypted_value)
+    except (TypeError, ValueError) as e:
+        raise ValueError("Failed to decrypt value: not valid base64") from e
+
+    # Anything shorter than a nonce plus the GCM tag cannot be AES-GCM output
+    if len(data) >= AES_NONCE_SIZE + AES_TAG_SIZE:
+        try:
+            plaintext = _get_aesgcm().decrypt(
+                data[:AES_NONCE_SIZE], data[AES_NONCE_SIZE:], None
+            )
+            return plaintext.decode()
+        except InvalidTag:
+            pass
+
+    try:
+        return _get_legacy_fernet().decrypt(encrypted_value).decode()
+    except InvalidToken as e:
+        raise ValueError("Failed to decrypt value") from e
 
 def hash_code(code: str) -> str:
     """
@@ -55,10 +106,35 @@ def hash_code(code: str) -> str:
     """
     return hashlib.sha256(code.encode()).hexdigest()
 
+@lru_cache(maxsize=4096)
+def _decode_totp_secret(secret_key: str) -> bytes:
+    """Decode a base32 TOTP secret, tolerating missing padding."""
+    padding = -len(secret_key) % 8
+    return base64.b32decode(secret_key + "=" * padding, casefold=True)
+
+def _totp_code(key: bytes, counter: int) -> bytes:
+    """Compute the TOTP code for a time step (RFC 4226 dynamic truncation)."""
+    digest = hmac.new(key, _TOTP_COUNTER.pack(counter), hashlib.sha1).digest()
+    offset = digest[-1] & 0x0F
+    value = int.from_bytes(digest[offset:offset + 4], "big") & 0x7FFFFFFF
+    return b"%0*d" % (TOTP_DIGITS, value % _TOTP_MODULO)
+
+def _is_well_formed_code(code: str) -> bool:
+    """Check that code is exactly TOTP_DIGITS ASCII digits."""
+    return (
+        isinstance(code, str)
+        and len(code) == TOTP_DIGITS
+        and code.isascii()
+        and code.isdigit()
+    )
+
 def verify_mfa_code(code: str, secret_key: str) -> bool:
     """
     Verify a TOTP code for MFA.
     
+    Codes from the adjacent time steps are accepted to tolerate clock drift.
+    Malformed codes are rejected before any secret decoding or HMAC work.
+    
     Args:
         code: The TOTP code to verify
         secret_key: The user's TOTP secret key
@@ -66,8 +142,16 @@ def verify_mfa_code(code: str, secret_key: str) -> bool:
     Returns:
         bool: True if code is valid, False otherwise
     """
-    totp = pyotp.TOTP(secret_key)
-    return totp.verify(code)
+    if not _is_well_formed_code(code):
+        return False
+    key = _decode_totp_secret(secret_key)
+    candidate = code.encode()
+    counter = int(time.time()) // TOTP_INTERVAL
+    valid = False
+    for step in range(counter - TOTP_VALID_WINDOW, counter + TOTP_VALID_WINDOW + 1):
+        # Check every step so timing does not reveal which one matched
+        valid |= hmac.compare_digest(candidate, _totp_code(key, step))
+    return valid
 
 # Export commonly used functions
 __all__ = [
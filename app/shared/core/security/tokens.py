@@ -1,14 +1,84 @@
-from datetime import datetime, timedelta
+import base64
+import hashlib
+import hmac
+import json
+import time
+from datetime import timedelta
 from typing import Any, Dict, Optional, Union, TYPE_CHECKING
 
 from fastapi import HTTPException, status
 from jose import JWTError, jwt
 
 from app.shared.core.config import settings
+from app.shared.core.constants import JWT_ALGORITHM
+
+# Fast JSON serializer for token payloads; json mints byte-identical tokens
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 if TYPE_CHECKING:
     from app.shared.models.user import User
 
+# Signing state is static for the lifetime of the process, so derive it once
+# instead of re-encoding the secret on every mint/verify.
+_SECRET_KEY_BYTES = settings.SECRET_KEY.encode()
+_ALGORITHM = getattr(settings, "JWT_ALGORITHM", JWT_ALGORITHM)
+_ALGORITHMS = [_ALGORITHM]
+
+_ACCESS_TOKEN_TTL = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
+_REFRESH_TOKEN_TTL = timedelta(days=settings.REFRESH_TOKEN_EXPIRE_DAYS)
+_VERIFICATION_TOKEN_TTL = timedelta(hours=24)
+_PASSWORD_RESET_TOKEN_TTL = timedelta(hours=1)
+
+_HMAC_DIGESTS = {
+    "HS256": hashlib.sha256,
+    "HS384": hashlib.sha384,
+    "HS512": hashlib.sha512,
+}
+_HMAC_DIGEST = _HMAC_DIGESTS.get(_ALGORITHM)
+
+def _b64url(data: bytes) -> bytes:
+    """Base64url-encode without padding, as JWS requires."""
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+if HAS_ORJSON:
+    _dump_claims = orjson.dumps
+else:
+    def _dump_claims(claims: Dict[str, Any]) -> bytes:
+        return json.dumps(claims, separators=(",", ":"), ensure_ascii=False).encode()
+
+# The JOSE header never changes, so serialize and encode it once
+_JWT_HEADER_B64 = _b64url(
+    json.dumps({"alg": _ALGORITHM, "typ": "JWT"}, separators=(",", ":"), ensure_ascii=False).encode()
+)
+
+def _subject_str(subject: Union[str, Any]) -> str:
+    """Return the subject as a string, skipping str() when it already is one."""
+    return subject if isinstance(subject, str) else str(subject)
+
+def _encode_token(
+    subject: str,
+    token_type: str,
+    expires_delta: Optional[timedelta],
+    default_ttl: timedelta
+) -> str:
+    """Sign a token with an integer ``exp`` claim (seconds since the epoch)."""
+    expires_delta = expires_delta or default_ttl
+    to_encode = {
+        "exp": int(time.time() + expires_delta.total_seconds()),
+        "sub": subject,
+        "type": token_type
+    }
+    if _HMAC_DIGEST is None:
+        return jwt.encode(to_encode, _SECRET_KEY_BYTES, algorithm=_ALGORITHM)
+    # HMAC algorithms: build the compact JWS directly (one HMAC, two base64 encodes)
+    signing_input = _JWT_HEADER_B64 + b"." + _b64url(_dump_claims(to_encode))
+    signature = hmac.new(_SECRET_KEY_BYTES, signing_input, _HMAC_DIGEST).digest()
+    return (signing_input + b"." + _b64url(signature)).decode()
+
 def create_access_token(
     subject: Union[str, Any],
     expires_delta: Optional[timedelta] = None
@@ -23,17 +93,7 @@ def create_access_token(
     Returns:
         str: JWT token
     """
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
-        )
-    to_encode = {"exp": expire, "sub": str(subject), "type": "access"}
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-    )
-    return encoded_jwt
+    return _encode_token(_subject_str(subject), "access", expires_delta, _ACCESS_TOKEN_TTL)
 
 def create_refresh_token(
     subject: Union[str, Any],
@@ -49,17 +109,7 @@ def create_refresh_token(
     Returns:
         str: JWT token
     """
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(
-            days=settings.REFRESH_TOKEN_EXPIRE_DAYS
-        )
-    to_encode = {"exp": expire, "sub": str(subject), "type": "refresh"}
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-    )
-    return encoded_jwt
+    return _encode_token(_subject_str(subject), "refresh", expires_delta, _REFRESH_TOKEN_TTL)
 
 def decode_access_token(token: str) -> Dict[str, Any]:
     """
@@ -75,11 +125,7 @@ def decode_access_token(token: str) -> Dict[str, Any]:
         JWTError: If token is invalid or expired
     """
     try:
-        payload = jwt.decode(
-            token,
-            settings.SECRET_KEY,
-            algorithms=[settings.JWT_ALGORITHM]
-        )
+        payload = jwt.decode(token, _SECRET_KEY_BYTES, algorithms=_ALGORITHMS)
         return payload
     except JWTError as e:
         raise JWTError(f"Could not validate token: {str(e)}")
@@ -87,7 +133,7 @@ def decode_access_token(token: str) -> Dict[str, Any]:
 def decode_refresh_token(token: str) -> dict:
     """Decode and verify JWT refresh token."""
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        payload = jwt.decode(token, _SECRET_KEY_BYTES, algorithms=_ALGORITHMS)
         return payload
     except jwt.JWTError:
         raise HTTPException(
@@ -110,7 +156,7 @@ def verify_jwt_token(token: str) -> Dict[str, Any]:
         HTTPException: If the token is invalid or expired
     """
     try:
-        payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[settings.JWT_ALGORITHM])
+        payload = jwt.decode(token, _SECRET_KEY_BYTES, algorithms=_ALGORITHMS)
         return payload
     except JWTError:
         raise HTTPException(
@@ -133,19 +179,9 @@ def generate_verification_token(
     Returns:
         str: JWT token
     """
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(hours=24)  # 24 hours by default
-    to_encode = {
-        "exp": expire,
-        "sub": email,
-        "type": "email_verification"
-    }
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM
+    return _encode_token(
+        email, "email_verification", expires_delta, _VERIFICATION_TOKEN_TTL
     )
-    return encoded_jwt
 
 def generate_password_reset_token(
     email: str,
@@ -161,16 +197,6 @@ def generate_password_reset_token(
     Returns:
         str: JWT token
     """
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(hours=1)  # 1 hour by default
-    to_encode = {
-        "exp": expire,
-        "sub": email,
-        "type": "password_reset"
-    }
-    encoded_jwt = jwt.encode(
-        to_encode, settings.SECRET_KEY, algorithm=settings.JWT_ALGORITHM
-    )
-    return encoded_jwt 
\ No newline at end of file
+    return _encode_token(
+        email, "password_reset", expires_delta, _PASSWORD_RESET_TOKEN_TTL
+    ) 
\ No newline at end of file
@@ -1,21 +1,204 @@
 """
 SMS and WhatsApp service module using Twilio.
+
+SMSService's send methods are coroutines; each has a blocking ``*_sync``
+counterpart for code that runs outside an event loop.
 """
 
 import asyncio
 import logging
 import os
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from typing import (Any, Awaitable, Callable, Dict, List, Optional, Set,
+                    Tuple)
 
-from ratelimit import limits, sleep_and_retry
+from requests.adapters import HTTPAdapter
 from sqlalchemy.orm import Session
 from twilio.base.exceptions import TwilioRestException
+from twilio.http.http_client import TwilioHttpClient
 from twilio.rest import Client
 
 from app.shared.core.exceptions import (CommunicationException,
                                         RateLimitException)
 from app.shared.core.infrastructure.logger_config import logger
+from app.shared.core.infrastructure.rate_limit import AsyncTokenBucket
+
+# Keep-alive pool shared by every Twilio request in the process
+TWILIO_POOL_CONNECTIONS = 50
+TWILIO_POOL_MAXSIZE = 100
+
+# Maximum concurrent sends within a send_bulk_sms batch
+BULK_SMS_CONCURRENCY = 20
+
+# Twilio send budget (100 messages per minute), shared across SMSService instances
+SMS_RATE_LIMIT = 100
+
+# Rate-limited sends are queued and submitted in batches of up to
+# SMS_BATCH_MAX, collected over at most SMS_BATCH_WINDOW seconds
+SMS_BATCH_MAX = 20
+SMS_BATCH_WINDOW = 0.01
+
+# Retry backoff: full jitter over BASE * 2**attempt, capped at MAX seconds
+SMS_RETRY_BASE_DELAY = 0.25
+SMS_RETRY_MAX_DELAY = 8.0
+
+# Twilio error codes: transient ones worth retrying, and those mapped to
+# a specific exception (built from the recipient number)
+_RETRYABLE_TWILIO_CODES = frozenset({20003, 20008, 20012})
+_INVALID_NUM, _RATE_LIMIT, _UNREACHABLE = 21211, 21608, 21614
+_TWILIO_ERROR_EXCEPTIONS = {
+    _INVALID_NUM: lambda to: CommunicationException(f"Invalid phone number: {to}"),
+    _RATE_LIMIT: lambda to: RateLimitException("SMS rate limit exceeded"),
+    _UNREACHABLE: lambda to: CommunicationException(f"Phone number {to} is unreachable"),
+}
+
+# (send coroutine factory, result future); None asks the batcher to stop
+_QueuedSMS = Tuple[Callable[[], Awaitable[Dict[str, Any]]], asyncio.Future]
+
+# str.translate table deleting every ASCII non-digit character
+_STRIP_NON_DIGITS = str.maketrans("", "", "".join(
+    chr(c) for c in range(128) if not chr(c).isdigit()
+))
+
+class PooledTwilioHttpClient(TwilioHttpClient):
+    """Twilio HTTP client whose session keeps a sized keep-alive pool."""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=TWILIO_POOL_CONNECTIONS,
+                pool_maxsize=TWILIO_POOL_MAXSIZE
+            )
+        )
+
+@lru_cache(maxsize=1)
+def _get_twilio_client(account_sid: str, auth_token: str) -> Client:
+    """Return the process-wide Twilio client for the given credentials."""
+    return Client(account_sid, auth_token, http_client=PooledTwilioHttpClient())
+
+@lru_cache(maxsize=1)
+def _get_twilio_executor() -> ThreadPoolExecutor:
+    """Return the thread pool for blocking Twilio calls, sized to the HTTP pool."""
+    return ThreadPoolExecutor(
+        max_workers=TWILIO_POOL_CONNECTIONS,
+        thread_name_prefix="twilio"
+    )
+
+@lru_cache(maxsize=1)
+def _get_sms_rate_limiter() -> AsyncTokenBucket:
+    """Return the process-wide Twilio send budget, created on first send."""
+    return AsyncTokenBucket(capacity=SMS_RATE_LIMIT, refill_rate=SMS_RATE_LIMIT / 60)
+
+@lru_cache(maxsize=1)
+def _get_service() -> "SMSService":
+    """Return the process-wide SMSService instance."""
+    return SMSService()
+
+class _SMSBatcher:
+    """
+    Process-wide queue that groups rate-limited sends into batches.
+    
+    A batch takes every send that arrives within SMS_BATCH_WINDOW of the
+    first (up to SMS_BATCH_MAX), pays the rate limiter once for all of them,
+    and is handed to the thread pool as a single gather. The worker task
+    starts on the first send and runs on that send's event loop until
+    aclose() drains it.
+    """
+    
+    def __init__(self):
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._batches: Set[asyncio.Task] = set()
+    
+    def _ensure_started(self) -> asyncio.Queue:
+        """Start the worker on the running loop if it is not already."""
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._task.done():
+            self._queue = asyncio.Queue()
+            self._loop = loop
+            self._task = loop.create_task(self._run(self._queue))
+        return self._queue
+    
+    async def submit(self, send: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        """Queue a send and wait for its batch to deliver it."""
+        queue = self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await queue.put((send, future))
+        return await future
+    
+    async def _run(self, queue: asyncio.Queue) -> None:
+        """Collect queued sends into batches until a None arrives."""
+        loop = asyncio.get_running_loop()
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            batch: List[_QueuedSMS] = [item]
+            closing = False
+            deadline = loop.time() + SMS_BATCH_WINDOW
+            while len(batch) < SMS_BATCH_MAX:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    break
+                if item is None:
+                    closing = True
+                    break
+                batch.append(item)
+            
+            await _get_sms_rate_limiter().acquire(len(batch))
+            
+            # Run the batch as its own task so the next one can be collected
+            task = loop.create_task(self._send_batch(batch))
+            self._batches.add(task)
+            task.add_done_callback(self._batches.discard)
+            if closing:
+                return
+    
+    @staticmethod
+    async def _send_batch(batch: List[_QueuedSMS]) -> None:
+        """Send a batch concurrently and resolve each caller's future."""
+        outcomes = await asyncio.gather(
+            *(send() for send, _ in batch),
+            return_exceptions=True
+        )
+        for (_, future), outcome in zip(batch, outcomes):
+            if future.done():  # Caller gave up waiting
+                continue
+            if isinstance(outcome, BaseException):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+    
+    async def aclose(self) -> None:
+        """Deliver every send already queued, then stop the worker."""
+        queue, task, loop = self._queue, self._task, self._loop
+        self._queue = self._task = self._loop = None
+        # A worker on another (likely closed) loop cannot be awaited from here
+        if task is None or task.done() or loop is not asyncio.get_running_loop():
+            return
+        # The worker reaches the stop marker only after every earlier send
+        await queue.put(None)
+        await task
+        batches = [batch for batch in self._batches if batch.get_loop() is loop]
+        if batches:
+            await asyncio.gather(*batches, return_exceptions=True)
+
+_batcher = _SMSBatcher()
+
+async def close_sms_batcher() -> None:
+    """Drain and stop the process-wide SMS batcher (call on app shutdown)."""
+    await _batcher.aclose()
 
 async def send_mfa_code_sms(
     phone_number: str,
@@ -35,8 +218,7 @@ async def send_mfa_code_sms(
     Returns:
         Dict containing message details and status
     """
-    sms_service = SMSService()
-    return await sms_service.send_mfa_code_sms(phone_number, code, customer_id)
+    return await _get_service().send_mfa_code_sms(phone_number, code, customer_id)
 
 class SMSService:
     """
@@ -48,23 +230,36 @@ class SMSService:
         Initialize Twilio service.
         """
         self.client = None
+        self._executor = _get_twilio_executor()
         self.account_sid = os.getenv("TWILIO_ACCOUNT_SID")
         self.auth_token = os.getenv("TWILIO_AUTH_TOKEN")
         self.from_number = os.getenv("TWILIO_PHONE_NUMBER")
         self.whatsapp_number = os.getenv("TWILIO_WHATSAPP_NUMBER")
         
+        # Static messages.create kwargs, merged into each send
+        self._base_sms = {"from_": self.from_number}
+        self._base_whatsapp = {"from_": f"whatsapp:{self.whatsapp_number}"}
+        
         if not all([self.account_sid, self.auth_token, self.from_number]):
             logger.warning("Twilio credentials not fully configured. SMS/WhatsApp service will not be available.")
             return
             
         try:
-            self.client = Client(self.account_sid, self.auth_token)
+            self.client = _get_twilio_client(self.account_sid, self.auth_token)
             logger.info("Twilio service initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize Twilio service: {str(e)}")
             raise CommunicationException("Failed to initialize Twilio service")
         
-    def send_sms(
+    async def _create_message(self, **params: Any):
+        """Run a blocking messages.create call on the Twilio thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor,
+            partial(self.client.messages.create, **params)
+        )
+
+    async def send_sms(
         self,
         to_number: str,
         message: str,
@@ -82,26 +277,22 @@ class SMSService:
             raise CommunicationException("Twilio service is not configured")
             
         try:
-            message_params = {
-                "from_": self.from_number,
-                "body": message,
-                "to": to_number
-            }
+            message_params = {**self._base_sms, "body": message, "to": to_number}
             
             if media_urls:
                 message_params["media_url"] = media_urls
                 
-            message = self.client.messages.create(**message_params)
-            logger.info(f"SMS sent to {to_number}, SID: {message.sid}")
+            message = await self._create_message(**message_params)
+            logger.info("SMS sent to %s, SID: %s", to_number, message.sid)
             return True
         except TwilioRestException as e:
-            logger.error(f"Twilio error: {str(e)}")
+            logger.error("Twilio error: %s", e)
             raise CommunicationException(f"Failed to send SMS: {str(e)}")
         except Exception as e:
-            logger.error(f"Failed to send SMS: {str(e)}")
+            logger.error("Failed to send SMS: %s", e)
             raise CommunicationException(f"Failed to send SMS: {str(e)}")
             
-    def send_whatsapp(
+    async def send_whatsapp(
         self,
         to_number: str,
         message: str,
@@ -119,39 +310,35 @@ class SMSService:
             raise CommunicationException("WhatsApp service is not configured")
             
         try:
-            # Format numbers for WhatsApp
-            from_whatsapp = f"whatsapp:{self.whatsapp_number}"
-            to_whatsapp = f"whatsapp:{to_number}"
-            
             message_params = {
-                "from_": from_whatsapp,
+                **self._base_whatsapp,
                 "body": message,
-                "to": to_whatsapp
+                "to": f"whatsapp:{to_number}"
             }
             
             if media_urls:
                 message_params["media_url"] = media_urls
                 
-            message = self.client.messages.create(**message_params)
-            logger.info(f"WhatsApp message sent to {to_number}, SID: {message.sid}")
+            message = await self._create_message(**message_params)
+            logger.info("WhatsApp message sent to %s, SID: %s", to_number, message.sid)
             return True
         except TwilioRestException as e:
-            logger.error(f"Twilio error: {str(e)}")
+            logger.error("Twilio error: %s", e)
             raise CommunicationException(f"Failed to send WhatsApp message: {str(e)}")
         except Exception as e:
-            logger.error(f"Failed to send WhatsApp message: {str(e)}")
+            logger.error("Failed to send WhatsApp message: %s", e)
             raise CommunicationException(f"Failed to send WhatsApp message: {str(e)}")
             
-    def send_verification_code(self, phone_number: str, code: str, use_whatsapp: bool = False) -> bool:
+    async def send_verification_code(self, phone_number: str, code: str, use_whatsapp: bool = False) -> bool:
         """
         Send verification code via SMS or WhatsApp.
         """
         message = f"Your verification code is: {code}"
         if use_whatsapp:
-            return self.send_whatsapp(phone_number, message)
-        return self.send_sms(phone_number, message)
+            return await self.send_whatsapp(phone_number, message)
+        return await self.send_sms(phone_number, message)
         
-    def send_notification(
+    async def send_notification(
         self,
         phone_number: str,
         notification_type: str,
@@ -162,13 +349,61 @@ class SMSService:
         """
         Send notification via SMS or WhatsApp.
         """
-        message = f"Notification: {notification_type}\n"
-        for key, value in data.items():
-            message += f"{key}: {value}\n"
+        message = "".join([
+            f"Notification: {notification_type}\n",
+            *(f"{key}: {value}\n" for key, value in data.items())
+        ])
             
         if use_whatsapp:
-            return self.send_whatsapp(phone_number, message, media_urls)
-        return self.send_sms(phone_number, message, media_urls)
+            return await self.send_whatsapp(phone_number, message, media_urls)
+        return await self.send_sms(phone_number, message, media_urls)
+
+    # Blocking variants for callers without an event loop (scripts, worker
+    # threads); each runs its coroutine to completion on a fresh loop
+    
+    @staticmethod
+    def _run_blocking(send: Callable[[], Awaitable[bool]]) -> bool:
+        """Run a send coroutine on a new event loop, refusing to nest in a running one."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(send())
+        raise RuntimeError("SMSService *_sync methods cannot run inside an event loop; await the async method")
+    
+    def send_sms_sync(
+        self,
+        to_number: str,
+        message: str,
+        media_urls: Optional[List[str]] = None
+    ) -> bool:
+        """Send an SMS message, blocking until Twilio responds."""
+        return self._run_blocking(partial(self.send_sms, to_number, message, media_urls))
+    
+    def send_whatsapp_sync(
+        self,
+        to_number: str,
+        message: str,
+        media_urls: Optional[List[str]] = None
+    ) -> bool:
+        """Send a WhatsApp message, blocking until Twilio responds."""
+        return self._run_blocking(partial(self.send_whatsapp, to_number, message, media_urls))
+    
+    def send_verification_code_sync(self, phone_number: str, code: str, use_whatsapp: bool = False) -> bool:
+        """Send a verification code, blocking until Twilio responds."""
+        return self._run_blocking(partial(self.send_verification_code, phone_number, code, use_whatsapp))
+    
+    def send_notification_sync(
+        self,
+        phone_number: str,
+        notification_type: str,
+        data: Dict[str, Any],
+        use_whatsapp: bool = False,
+        media_urls: Optional[List[str]] = None
+    ) -> bool:
+        """Send a notification, blocking until Twilio responds."""
+        return self._run_blocking(partial(
+            self.send_notification, phone_number, notification_type, data, use_whatsapp, media_urls
+        ))
 
     async def send_mfa_code_sms(
         self,
@@ -191,8 +426,6 @@ class SMSService:
         # Pass only supported params or delegate to `send_sms_with_rate_limit`
         return await self.send_sms_with_rate_limit(phone_number, message, customer_id=customer_id)
 
-    @sleep_and_retry
-    @limits(calls=100, period=60)  # 100 calls per minute
     async def send_sms_with_rate_limit(
         self,
         to_number: str,
@@ -216,8 +449,21 @@ class SMSService:
             CommunicationException: If message sending fails
             RateLimitException: If rate limit is exceeded
         """
+        # Queue for the batcher, which also waits on the rate limiter
+        return await _batcher.submit(
+            partial(self._deliver_sms, to_number, message, customer_id, retry_count)
+        )
+
+    async def _deliver_sms(
+        self,
+        to_number: str,
+        message: str,
+        customer_id: Optional[int],
+        retry_count: int
+    ) -> Dict[str, Any]:
+        """Send one queued SMS; rate limiting is done by the batcher."""
         try:
-            logger.info(f"Sending SMS to {to_number} for customer {customer_id}")
+            logger.info("Sending SMS to %s for customer %s", to_number, customer_id)
             
             # Validate phone number format
             if not self._validate_phone_number(to_number):
@@ -227,46 +473,43 @@ class SMSService:
             if len(message) > 1600:  # Twilio's limit
                 raise CommunicationException("Message exceeds maximum length of 1600 characters")
 
-            loop = asyncio.get_running_loop()
-            twilio_msg = await loop.run_in_executor(
-                None,
-                lambda: self.client.messages.create(
-                    body=message,
-                    from_=self.from_number,
-                    to=to_number
-                )
+            twilio_msg = await self._create_message(
+                **self._base_sms,
+                body=message,
+                to=to_number
             )
             
-            logger.info(f"SMS sent successfully. Message SID: {twilio_msg.sid}")
+            logger.info("SMS sent successfully. Message SID: %s", twilio_msg.sid)
             
             return {
                 "status": "success",
                 "message_id": twilio_msg.sid,
                 "to": to_number,
                 "customer_id": customer_id,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": datetime.fromtimestamp(time.time(), tz=timezone.utc).isoformat()
             }
             
         except TwilioRestException as e:
-            logger.error(f"Twilio error sending SMS: {str(e)}")
+            logger.error("Twilio error sending SMS: %s", e)
             
             # Handle specific Twilio error codes
-            if e.code == 21211:  # Invalid phone number
-                raise CommunicationException(f"Invalid phone number: {to_number}")
-            elif e.code == 21608:  # Rate limit exceeded
-                raise RateLimitException("SMS rate limit exceeded")
-            elif e.code == 21614:  # Unreachable number
-                raise CommunicationException(f"Phone number {to_number} is unreachable")
+            make_error = _TWILIO_ERROR_EXCEPTIONS.get(e.code)
+            if make_error is not None:
+                raise make_error(to_number)
             
             # Retry on certain error codes
-            if retry_count < 3 and e.code in [20003, 20008, 20012]:  # Retryable errors
-                logger.warning(f"Retrying SMS send. Attempt {retry_count + 1}")
-                return await self.send_sms_with_rate_limit(to_number, message, customer_id, retry_count + 1)
+            if retry_count < 3 and e.code in _RETRYABLE_TWILIO_CODES:
+                logger.warning("Retrying SMS send. Attempt %d", retry_count + 1)
+                # Back off before retrying; the retry reuses this send's
+                # rate-limit token rather than queueing for a new one
+                delay = min(SMS_RETRY_MAX_DELAY, SMS_RETRY_BASE_DELAY * 2 ** retry_count)
+                await asyncio.sleep(delay * random.random())
+                return await self._deliver_sms(to_number, message, customer_id, retry_count + 1)
             
             raise CommunicationException(f"Failed to send SMS: {str(e)}")
             
         except Exception as e:
-            logger.error(f"Unexpected error sending SMS: {str(e)}")
+            logger.error("Unexpected error sending SMS: %s", e)
             raise CommunicationException(f"Failed to send SMS: {str(e)}")
 
     async def send_bulk_sms(
@@ -286,55 +529,81 @@ class SMSService:
             batch_size: Number of messages to send in each batch
             
         Returns:
-            Dict containing results for each message
+            Dict containing results for each message. Numbers that normalize
+            to the same digits are sent once; ``results`` still has one entry
+            per input number, in input order.
         """
-        results = []
+        sent_results = []
         errors = []
-        start_time = datetime.utcnow()
+        start_time = time.perf_counter()
         
-        logger.info(f"Starting bulk SMS send to {len(numbers)} recipients")
+        # Send once per distinct recipient (compared by digits)
+        recipients: Dict[str, str] = {}
+        for number in numbers:
+            recipients.setdefault(self._recipient_key(number), number)
+        unique_numbers = list(recipients.values())
         
-        # Process in batches to avoid overwhelming the API
-        for i in range(0, len(numbers), batch_size):
-            batch = numbers[i:i + batch_size]
-            batch_results = []
-            
-            for number in batch:
+        logger.info("Starting bulk SMS send to %d recipients", len(unique_numbers))
+        
+        # Overlap Twilio round-trips within a batch, bounded by the semaphore
+        semaphore = asyncio.Semaphore(BULK_SMS_CONCURRENCY)
+
+        async def send_one(number: str) -> Dict[str, Any]:
+            async with semaphore:
                 try:
-                    result = await self.send_sms_with_rate_limit(number, message, customer_id)
-                    batch_results.append(result)
+                    return await self.send_sms_with_rate_limit(number, message, customer_id)
                 except (CommunicationException, RateLimitException) as e:
-                    logger.error(f"Error sending SMS to {number}: {str(e)}")
+                    logger.error("Error sending SMS to %s: %s", number, e)
                     errors.append({
                         "number": number,
                         "error": str(e)
                     })
-                    batch_results.append({
+                    return {
                         "status": "error",
                         "to": number,
                         "error": str(e)
-                    })
-            
-            results.extend(batch_results)
-            
-            # Add delay between batches to respect rate limits
-            if i + batch_size < len(numbers):
-                await asyncio.sleep(1)
+                    }
         
-        end_time = datetime.utcnow()
-        duration = (end_time - start_time).total_seconds()
+        # Process in batches to avoid overwhelming the API
+        for i in range(0, len(unique_numbers), batch_size):
+            batch = unique_numbers[i:i + batch_size]
+            batch_results = await asyncio.gather(*(send_one(number) for number in batch))
+            sent_results.extend(batch_results)
+        
+        # Fan each send's result back out to every input position
+        result_by_key = {
+            self._recipient_key(number): result
+            for number, result in zip(unique_numbers, sent_results)
+        }
+        results = [result_by_key[self._recipient_key(number)] for number in numbers]
+        
+        duration = time.perf_counter() - start_time
+        successful = sum(1 for r in sent_results if r["status"] == "success")
+        failed = len(sent_results) - successful
+        logger.info(
+            "Bulk SMS completed: total=%d success=%d failed=%d duration=%.3f",
+            len(unique_numbers), successful, failed, duration
+        )
         
         return {
             "status": "completed",
-            "total_messages": len(numbers),
-            "successful": sum(1 for r in results if r["status"] == "success"),
-            "failed": sum(1 for r in results if r["status"] == "error"),
+            "total_recipients": len(numbers),
+            "total_messages": len(unique_numbers),
+            "successful": successful,
+            "failed": failed,
             "errors": errors,
             "duration_seconds": duration,
             "results": results
         }
 
-    def _validate_phone_number(self, number: str) -> bool:
+    @staticmethod
+    def _recipient_key(number: str) -> str:
+        """Normalize a phone number for de-duplication (its digits, or itself)."""
+        return number.translate(_STRIP_NON_DIGITS) or number
+
+    @staticmethod
+    @lru_cache(maxsize=8192)
+    def _validate_phone_number(number: str) -> bool:
         """
         Validate phone number format.
         
@@ -344,13 +613,15 @@ class SMSService:
         Returns:
             bool: True if valid, False otherwise
         """
-        # Remove any non-digit characters
-        digits = ''.join(filter(str.isdigit, number))
+        # Remove any non-digit characters (C-level translate for the ASCII case)
+        digits = number.translate(_STRIP_NON_DIGITS)
+        if not digits.isascii():
+            digits = ''.join(filter(str.isdigit, digits))
         
         # Basic validation (can be enhanced based on requirements)
         return len(digits) >= 10 and len(digits) <= 15 
 
 # Create a singleton instance
-sms_service = SMSService()
+sms_service = _get_service()
 
 __all__ = ["sms_service"] 
\ No newline at end of file
@@ -1,22 +1,72 @@
+import asyncio
 import hashlib
-from datetime import datetime, timedelta
+import json
+import os
+import shutil
+import tempfile
+import time
+import uuid
+from collections import OrderedDict
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
 
 import httpx
 
 from app.shared.core.config import settings
-from datetime import datetime
-from typing import Dict
-from typing import Any
-from datetime import timedelta
-from datetime import datetime
-from typing import Dict
-from typing import Any
-from datetime import timedelta
+from app.shared.core.infrastructure.rate_limit import AsyncTokenBucket
+
+try:
+    import orjson
+    HAS_ORJSON = True
+except ImportError:
+    HAS_ORJSON = False
 
 RATE_LIMIT = 100  # requests per minute
 
+# Connection pool for the shared ElevenLabs client; HTTP/2 lets concurrent
+# requests multiplex over a single TLS connection.
+HTTP_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=50,
+    keepalive_expiry=60
+)
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+# Connection attempts retried on connect errors/timeouts
+HTTP_CONNECT_RETRIES = 3
+
+# Bytes read per chunk when streaming generated audio to disk
+STREAM_CHUNK_SIZE = 65536
+
+# Number of cache entries remembered as present on disk
+KNOWN_CACHE_ENTRIES = 4096
+
+# Voice metadata rarely changes; reuse API responses for this many seconds
+VOICES_CACHE_TTL = 3600
+VOICE_DETAILS_CACHE_SIZE = 256
+
+if HAS_ORJSON:
+    _dump_json = orjson.dumps
+else:
+    def _dump_json(payload: Dict[str, Any]) -> bytes:
+        return json.dumps(payload, separators=(",", ":")).encode()
+
+@lru_cache(maxsize=1024)
+def _cache_key(text: str, voice_id: str, model_id: str) -> str:
+    """Derive the cache key for a text/voice/model combination (BLAKE2b-128)."""
+    # NUL-separated so field boundaries can't collide; one encode, one hash call
+    payload = "\0".join((text, voice_id, model_id)).encode()
+    return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+
+def _fsync_path(path: str) -> None:
+    """Flush a file's data to stable storage."""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+
 class TextToSpeechService:
     """Service for text-to-speech conversion using ElevenLabs API."""
     
@@ -33,104 +83,249 @@ class TextToSpeechService:
         self.output_format = settings.ELEVENLABS_OUTPUT_FORMAT
         if not self.output_format:
             raise RuntimeError("ELEVENLABS_OUTPUT_FORMAT is not configured")
+        
+        # Request body fields that are the same for every generation
+        self._request_fields = {
+            "model_id": self.model_id,
+            "output_format": self.output_format
+        }
 
         # Create cache directory
         self.cache_dir = Path("cache/audio")
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        # Audio bytes stored once by content hash; cache entries link here
+        self.blob_dir = self.cache_dir / "blobs"
+        self.blob_dir.mkdir(exist_ok=True)
+        # Hot paths join plain strings rather than building Path objects
+        self._cache_dir_str = str(self.cache_dir)
+        self._blob_dir_str = str(self.blob_dir)
+        # LRU of cache keys already known to be on disk -> file path
+        self._known_paths: "OrderedDict[str, str]" = OrderedDict()
+        # Cache key -> task generating that audio
+        self._inflight: Dict[str, asyncio.Task] = {}
+        # (expires_at, response) for the voice list, and per-voice LRU
+        self._voices: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._voice_details: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
         
-        # Initialize request count tracking
-        self.request_count = 0
-        self.last_reset = datetime.utcnow()
+        # Token bucket smoothing requests to RATE_LIMIT per minute
+        self._rate_limiter = AsyncTokenBucket(capacity=RATE_LIMIT, refill_rate=RATE_LIMIT / 60)
         
-        # Initialize async client
+        # Initialize async client (requires httpx[http2]); it owns the base URL
+        # and auth headers, so requests only pass the endpoint path
         self.client = httpx.AsyncClient(
-            base_url="https://api.elevenlabs.io/v1",
+            base_url=settings.ELEVENLABS_API_URL,
+            transport=httpx.AsyncHTTPTransport(
+                http2=True,
+                limits=HTTP_LIMITS,
+                retries=HTTP_CONNECT_RETRIES
+            ),
             headers={
                 "xi-api-key": self.api_key,
                 "Content-Type": "application/json"
             },
-            timeout=30.0  # 30 second timeout
+            timeout=HTTP_TIMEOUT
         )
 
     async def generate_audio(self, text: str, voice_id: str = "default") -> str:
         """Generate audio from text using ElevenLabs API."""
         try:
-            # Check rate limit
-            self._check_rate_limit()
-            
-            # Check cache first
+            # Check cache first: in-memory index
             cache_key = self._get_cache_key(text, voice_id)
-            cache_path = self.cache_dir / f"{cache_key}.{self.output_format}"
-            
-            if cache_path.exists():
-                return str(cache_path)
+            known_path = self._known_paths.get(cache_key)
+            if known_path is not None:
+                self._known_paths.move_to_end(cache_key)
+                return known_path
             
-            # Make API request
-            response = await self.client.post(
-                "/text-to-speech",
-                json={
-                    "text": text,
-                    "model_id": self.model_id,
-                    "voice_id": voice_id,
-                    "output_format": self.output_format
-                }
-            )
-            response.raise_for_status()
-            
-            # Save to cache
-            cache_path.write_bytes(response.content)
-            return str(cache_path)
+            # Join an identical request that is already being generated. The
+            # generation runs in its own task, so a caller that is cancelled
+            # (including the one that started it) leaves the others waiting
+            task = self._inflight.get(cache_key)
+            if task is None:
+                task = asyncio.get_running_loop().create_task(
+                    self._load_audio(text, voice_id, cache_key)
+                )
+                self._inflight[cache_key] = task
+                task.add_done_callback(partial(self._finish_inflight, cache_key))
+            return await asyncio.shield(task)
             
         except httpx.HTTPError as e:
             raise RuntimeError(f"Failed to generate audio: {str(e)}")
         except Exception as e:
             raise RuntimeError(f"Unexpected error: {str(e)}")
 
+    def _finish_inflight(self, cache_key: str, task: asyncio.Task) -> None:
+        """Forget a finished generation so the next miss starts a new one."""
+        if self._inflight.get(cache_key) is task:
+            del self._inflight[cache_key]
+        if not task.cancelled():
+            task.exception()  # Mark retrieved in case every caller gave up
+
+    async def generate_audio_batch(self, texts: List[str], voice_id: str = "default") -> List[str]:
+        """
+        Generate audio for several texts (e.g. IVR menu prompts) at once.
+        
+        Each distinct text goes through generate_audio concurrently: cache hits
+        return immediately and misses share the client's HTTP/2 connection.
+        
+        Returns:
+            Audio file paths, aligned with texts
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        paths = await asyncio.gather(*(self.generate_audio(text, voice_id) for text in unique_texts))
+        path_by_text = dict(zip(unique_texts, paths))
+        return [path_by_text[text] for text in texts]
+
+    async def _load_audio(self, text: str, voice_id: str, cache_key: str) -> str:
+        """Return the cached audio file for cache_key, generating it on a miss."""
+        # Check the disk cache off the event loop
+        cache_path = os.path.join(self._cache_dir_str, f"{cache_key}.{self.output_format}")
+        if await asyncio.to_thread(os.path.exists, cache_path):
+            return self._remember_cached(cache_key, cache_path)
+        
+        # Wait for rate-limit capacity (cache hits never reach the API)
+        await self._rate_limiter.acquire()
+        
+        # Make API request, streaming the audio straight to disk
+        async with self.client.stream(
+            "POST",
+            "/text-to-speech",
+            content=_dump_json({**self._request_fields, "text": text, "voice_id": voice_id})
+        ) as response:
+            response.raise_for_status()
+            tmp_path, digest = await self._download_audio(response)
+        
+        # Save to cache
+        await asyncio.to_thread(self._store_audio, tmp_path, digest, cache_path)
+        return self._remember_cached(cache_key, cache_path)
+
     async def get_available_voices(self) -> Dict[str, Any]:
-        """Get list of available voices."""
+        """Get list of available voices (cached for VOICES_CACHE_TTL seconds)."""
+        now = time.monotonic()
+        if self._voices is not None and self._voices[0] > now:
+            return self._voices[1]
         try:
             response = await self.client.get("/voices")
             response.raise_for_status()
-            return response.json()
+            voices = response.json()
+            self._voices = (now + VOICES_CACHE_TTL, voices)
+            return voices
         except httpx.HTTPError as e:
             raise RuntimeError(f"Failed to get voices: {str(e)}")
 
     async def get_voice_details(self, voice_id: str) -> Dict[str, Any]:
-        """Get details for a specific voice."""
+        """Get details for a specific voice (cached for VOICES_CACHE_TTL seconds)."""
+        now = time.monotonic()
+        cached = self._voice_details.get(voice_id)
+        if cached is not None and cached[0] > now:
+            self._voice_details.move_to_end(voice_id)
+            return cached[1]
         try:
             response = await self.client.get(f"/voices/{voice_id}")
             response.raise_for_status()
-            return response.json()
+            details = response.json()
+            self._voice_details[voice_id] = (now + VOICES_CACHE_TTL, details)
+            self._voice_details.move_to_end(voice_id)
+            if len(self._voice_details) > VOICE_DETAILS_CACHE_SIZE:
+                self._voice_details.popitem(last=False)
+            return details
         except httpx.HTTPError as e:
             raise RuntimeError(f"Failed to get voice details: {str(e)}")
 
     async def generate_temp_audio(self, text: str, voice_id: str = "default") -> str:
-        """Generate temporary audio file and return its path."""
-        try:
-            audio_path = await self.generate_audio(text, voice_id)
-            return audio_path
-        except Exception as e:
-            raise RuntimeError(f"Failed to generate temporary audio: {str(e)}")
-
-    def _check_rate_limit(self):
-        """Check if we've exceeded the rate limit."""
-        now = datetime.utcnow()
-        if now - self.last_reset > timedelta(minutes=1):
-            self.request_count = 0
-            self.last_reset = now
-            
-        if self.request_count >= RATE_LIMIT:
-            raise RuntimeError("Rate limit exceeded")
-            
-        self.request_count += 1
+        """
+        Generate audio and return its path.
+        
+        The path is the shared cache entry itself (no temporary copy is made),
+        so callers must not modify or delete it.
+        """
+        return await self.generate_audio(text, voice_id)
 
     def _get_cache_key(self, text: str, voice_id: str) -> str:
         """Generate cache key for text and voice combination."""
-        key = f"{text}_{voice_id}_{self.model_id}"
-        return hashlib.md5(key.encode()).hexdigest()
+        return _cache_key(text, voice_id, self.model_id)
+
+    async def _download_audio(self, response: httpx.Response) -> Tuple[str, str]:
+        """
+        Stream response audio into a temporary file in the blob store.
+        
+        Returns:
+            The temporary file path and the BLAKE2b-128 hex digest of its content
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        # File creation, writes and the final flush/close all run off the event loop
+        fd, tmp_path = await asyncio.to_thread(tempfile.mkstemp, dir=self._blob_dir_str)
+        write = None
+        try:
+            f = open(fd, "wb")
+            try:
+                async for chunk in response.aiter_bytes(chunk_size=STREAM_CHUNK_SIZE):
+                    digest.update(chunk)
+                    # Write each chunk while the next one is read from the socket
+                    if write is not None:
+                        await write
+                    write = asyncio.ensure_future(asyncio.to_thread(f.write, chunk))
+            finally:
+                try:
+                    if write is not None:
+                        await write
+                finally:
+                    await asyncio.to_thread(f.close)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+        return tmp_path, digest.hexdigest()
+
+    def _store_audio(self, tmp_path: str, digest: str, cache_path: str) -> None:
+        """
+        Move downloaded audio into the content-addressed blob store and link
+        cache_path to it.
+        
+        Both the blob and the cache entry are written under a temporary name and
+        renamed into place, so a crash never leaves a truncated file at a path
+        the cache lookup would return. New data is fsynced before its rename so
+        that also holds across a power loss, not just a killed process.
+        """
+        blob_path = os.path.join(self._blob_dir_str, f"{digest}.{self.output_format}")
+        if os.path.exists(blob_path):
+            os.unlink(tmp_path)
+        else:
+            _fsync_path(tmp_path)
+            os.replace(tmp_path, blob_path)
+        
+        tmp_path = os.path.join(self._cache_dir_str, f".{uuid.uuid4().hex}.tmp")
+        try:
+            os.link(blob_path, tmp_path)
+        except OSError:
+            # Filesystem without hardlinks: fall back to a private copy
+            shutil.copyfile(blob_path, tmp_path)
+            _fsync_path(tmp_path)
+        os.replace(tmp_path, cache_path)
+        # rename() is a no-op when both names already link the same blob
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+
+    def _remember_cached(self, cache_key: str, cache_path: str) -> str:
+        """Record a cache entry as present on disk and return its path."""
+        self._known_paths[cache_key] = cache_path
+        if len(self._known_paths) > KNOWN_CACHE_ENTRIES:
+            self._known_paths.popitem(last=False)
+        return cache_path
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.client.aclose() 
\ No newline at end of file
+        await self.client.aclose() 
+
+@lru_cache(maxsize=1)
+def get_tts_service() -> TextToSpeechService:
+    """Return the process-wide TextToSpeechService, so callers share one connection pool."""
+    return TextToSpeechService()
+
+async def close_tts_service() -> None:
+    """Close the shared service's HTTP client, if the service was ever created."""
+    if get_tts_service.cache_info().currsize:
+        await get_tts_service().client.aclose()
+        get_tts_service.cache_clear()
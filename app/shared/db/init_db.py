@@ -1,20 +1,23 @@
 from sqlalchemy.orm import Session
-from sqlalchemy import create_engine
 
 from app.shared.core.security import get_password_hash
 from app.shared.models.customer import Customer
 from app.shared.models.user import Permission, Role, User
-from app.shared.core.config import settings
 from app.shared.db.base_class import Base
+from app.shared.db.session import engine
 from app.scraping.models.scraping import ScrapingConfig
 
 def create_tables():
     """Create all database tables."""
-    engine = create_engine(settings.DATABASE_URL)
     Base.metadata.create_all(bind=engine)
 
 def init_db(db: Session) -> None:
-    """Initialize the database with required data."""
+    """
+    Initialize the database with required data.
+    
+    All seed rows are added to the session and committed together, in a
+    single transaction.
+    """
     # Create default roles
     roles = [
         Role(name="admin", description="Administrator"),
@@ -23,11 +26,15 @@ def init_db(db: Session) -> None:
         Role(name="user", description="Regular User")
     ]
     
-    for role in roles:
-        if not db.query(Role).filter(Role.name == role.name).first():
-            db.add(role)
-    
-    db.commit()
+    # One IN query for the roles that already exist; add the rest
+    role_names = [role.name for role in roles]
+    roles_by_name = {
+        role.name: role
+        for role in db.query(Role).filter(Role.name.in_(role_names))
+    }
+    new_roles = [role for role in roles if role.name not in roles_by_name]
+    db.add_all(new_roles)
+    roles_by_name.update((role.name, role) for role in new_roles)
     
     # Create default permissions
     permissions = [
@@ -39,11 +46,14 @@ def init_db(db: Session) -> None:
         Permission(name="manage_settings", description="Can manage settings")
     ]
     
-    for permission in permissions:
-        if not db.query(Permission).filter(Permission.name == permission.name).first():
-            db.add(permission)
-    
-    db.commit()
+    permission_names = [permission.name for permission in permissions]
+    existing_permissions = {
+        name for (name,) in db.query(Permission.name).filter(Permission.name.in_(permission_names))
+    }
+    db.add_all([
+        permission for permission in permissions
+        if permission.name not in existing_permissions
+    ])
 
     # Create customers
     customer1 = Customer(
@@ -58,57 +68,48 @@ def init_db(db: Session) -> None:
         phone="098-765-4321",
         address="456 Oak St"
     )
-    db.add(customer1)
-    db.add(customer2)
-    db.commit()
 
-    # Create users for customer1
-    admin_user = User(
-        email="admin@firma.com",
-        password_hash=get_password_hash("admin123"),
-        is_active=True,
-        is_superuser=True,
-        customer_id=customer1.id
-    )
-    agent_user = User(
-        email="agent@firma.com",
-        password_hash=get_password_hash("agent123"),
-        is_active=True,
-        is_superuser=False,
-        customer_id=customer1.id
-    )
-    db.add(admin_user)
-    db.add(agent_user)
-    db.commit()
+    admin_role = roles_by_name["admin"]
+    agent_role = roles_by_name["agent"]
 
-    # Assign roles to users
-    admin_role = db.query(Role).filter(Role.name == "admin").first()
-    agent_role = db.query(Role).filter(Role.name == "agent").first()
-    
-    admin_user.roles = [admin_role]
-    agent_user.roles = [agent_role]
-    db.commit()
+    # Create users with their roles; customer_id is filled in from the
+    # customer relationship when the transaction is flushed
+    users = [
+        # Users for customer1
+        User(
+            email="admin@firma.com",
+            password_hash=get_password_hash("admin123"),
+            is_active=True,
+            is_superuser=True,
+            customer=customer1,
+            roles=[admin_role]
+        ),
+        User(
+            email="agent@firma.com",
+            password_hash=get_password_hash("agent123"),
+            is_active=True,
+            is_superuser=False,
+            customer=customer1,
+            roles=[agent_role]
+        ),
+        # Users for customer2
+        User(
+            email="admin@firmb.com",
+            password_hash=get_password_hash("admin123"),
+            is_active=True,
+            is_superuser=True,
+            customer=customer2,
+            roles=[admin_role]
+        ),
+        User(
+            email="agent@firmb.com",
+            password_hash=get_password_hash("agent123"),
+            is_active=True,
+            is_superuser=False,
+            customer=customer2,
+            roles=[agent_role]
+        )
+    ]
 
-    # Create users for customer2
-    admin_user2 = User(
-        email="admin@firmb.com",
-        password_hash=get_password_hash("admin123"),
-        is_active=True,
-        is_superuser=True,
-        customer_id=customer2.id
-    )
-    agent_user2 = User(
-        email="agent@firmb.com",
-        password_hash=get_password_hash("agent123"),
-        is_active=True,
-        is_superuser=False,
-        customer_id=customer2.id
-    )
-    db.add(admin_user2)
-    db.add(agent_user2)
+    db.add_all([customer1, customer2, *users])
     db.commit()
-
-    # Assign roles to users for customer2
-    admin_user2.roles = [admin_role]
-    agent_user2.roles = [agent_role]
-    db.commit() 
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""
+Explicit relationship loading for list queries.
+
+List queries name every relationship they render with selectinload() or
+joinedload() and pass those options through explicit_loading(); mapper-level
+eager defaults are not applied to any other relationship. In debug mode those
+other relationships are raiseload()-ed, so an accidental lazy load (an N+1 in
+the making) fails loudly during development; in production they fall back to
+plain lazy loading.
+"""
+
+from typing import Any, Tuple
+
+from sqlalchemy.orm import lazyload, raiseload
+
+from app.shared.core.config import settings
+
+
+def explicit_loading(*options: Any) -> Tuple[Any, ...]:
+    """
+    Loader options for a list query.
+    
+    Args:
+        options: The eager-loading options for the relationships the caller uses
+        
+    Returns:
+        options, followed by a wildcard raiseload("*") when settings.DEBUG is
+        enabled, lazyload("*") otherwise
+    """
+    fallback = raiseload("*") if settings.DEBUG else lazyload("*")
+    return (*options, fallback)
@@ -24,15 +24,12 @@ logger.addHandler(console_handler)
 # Log the database URL being used
 logger.info(f"Using database URL: {settings.database_url}")
 
-# Create SQLAlchemy engine
+# Create SQLAlchemy engine; this is the application's only engine/pool,
+# re-exported by the other session modules
 engine = create_engine(
     settings.database_url,
     pool_pre_ping=True,
-    pool_size=settings.DB_POOL_SIZE,
-    max_overflow=settings.DB_MAX_OVERFLOW,
-    pool_timeout=settings.DB_POOL_TIMEOUT,
-    pool_recycle=settings.DB_POOL_RECYCLE,
-    echo=settings.DB_ECHO
+    **settings.get_database_engine_options
 )
 
 # Create session factory
@@ -51,4 +48,4 @@ def get_db() -> Generator[Session, None, None]:
     finally:
         db.close()
 
-__all__ = ["get_db", "SessionLocal"] 
\ No newline at end of file
+__all__ = ["get_db", "SessionLocal", "engine"] 
\ No newline at end of file
@@ -0,0 +1,33 @@
+"""
+Column types shared by the models.
+"""
+
+import enum
+from typing import Type
+
+from sqlalchemy import JSON, Enum
+from sqlalchemy.dialects.postgresql import JSONB
+
+# Binary JSON on PostgreSQL (parsed once on write, GIN-indexable); plain JSON
+# on other databases such as the SQLite test database
+JSONType = JSON().with_variant(JSONB(), "postgresql")
+
+
+def StringEnum(enum_class: Type[enum.Enum]) -> Enum:
+    """
+    Enum column type stored as VARCHAR with a CHECK constraint.
+    
+    Members are stored by value (e.g. "email", not "EMAIL"), so plain string
+    comparisons work, and adding a member only means replacing the check
+    constraint instead of altering a native PostgreSQL ENUM type.
+    """
+    return Enum(
+        enum_class,
+        name=enum_class.__name__.lower(),
+        native_enum=False,
+        create_constraint=True,
+        validate_strings=True,
+        values_callable=lambda members: [member.value for member in members]
+    )
+
+__all__ = ["JSONType", "StringEnum"]
@@ -46,3 +46,10 @@ __all__ = [
 # Configure mappers after all models are imported
 from sqlalchemy.orm import configure_mappers
 configure_mappers()
+
+# These tables used to be mapped by several competing classes; keep it at one
+for _table_name in ("projects", "user_sessions", "users"):
+    assert len({
+        mapper.class_ for mapper in Base.registry.mappers
+        if mapper.local_table.name == _table_name
+    }) == 1, f"{_table_name} is mapped by more than one class"
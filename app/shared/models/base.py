@@ -1,11 +1,8 @@
 from datetime import datetime
 
 from sqlalchemy import Column, DateTime, Integer
-from sqlalchemy.ext.declarative import declarative_base
-from datetime import datetime
-from datetime import datetime
 
-Base = declarative_base()
+from app.shared.db.base_class import Base
 
 class BaseModel(Base):
     """Base model class that includes common fields for all models."""
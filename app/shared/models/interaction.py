@@ -1,10 +1,13 @@
 import enum
+import uuid
 
-from sqlalchemy import (JSON, Column, DateTime, Enum, Float,
-                        ForeignKey, Integer, String, Text)
-from sqlalchemy.orm import relationship
+from sqlalchemy import (Column, DateTime, Float,
+                        ForeignKey, Index, Integer, String, Text)
+from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.orm import deferred, relationship
 
 from app.shared.db.base_class import Base
+from app.shared.db.types import JSONType, StringEnum
 
 class InteractionType(enum.Enum):
     CALL = "call"
@@ -31,55 +34,61 @@ class CommunicationChannel(str, enum.Enum):
 
 class InteractionLog(Base):
     __tablename__ = "interaction_logs"
-    __table_args__ = {'extend_existing': True}
+    __table_args__ = (
+        # A lead's interaction history, ordered by start time
+        Index("ix_interaction_logs_lead_start", "lead_id", "start_time"),
+        {'extend_existing': True}
+    )
     
-    id = Column(String(36), primary_key=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     lead_id = Column(String(36), ForeignKey('leads.id'))
-    customer_id = Column(String(36), ForeignKey('customers.id'))
-    interaction_type = Column(Enum(InteractionType))
-    status = Column(Enum(InteractionStatus))
+    customer_id = Column(UUID(as_uuid=True), ForeignKey('customers.id'))
+    interaction_type = Column(StringEnum(InteractionType))
+    status = Column(StringEnum(InteractionStatus))
     start_time = Column(DateTime)
     end_time = Column(DateTime)
     duration = Column(Integer)  # Duration in seconds
-    user_input = Column(JSON)  # Store user inputs/choices
+    user_input = Column(JSONType)  # Store user inputs/choices
     error_message = Column(Text)
     response_time = Column(Float)  # Average response time in seconds
-    model_metadata = Column(JSON)  # Additional interaction metadata
+    model_metadata = Column(JSONType)  # Additional interaction metadata
     
     # Use string references for relationships
-    lead = relationship("Lead", back_populates="interactions", foreign_keys=[lead_id])
-    customer = relationship("Customer", foreign_keys=[customer_id])
+    lead = relationship("Lead", back_populates="interactions", foreign_keys=[lead_id], lazy="selectin")
+    customer = relationship("Customer", foreign_keys=[customer_id], lazy="selectin")
 
 class CallInteraction(Base):
     __tablename__ = "call_interactions"
     __table_args__ = {'extend_existing': True}
     
-    id = Column(String(36), primary_key=True, index=True)
-    interaction_id = Column(String(36), ForeignKey('interaction_logs.id'))
-    call_sid = Column(String)  # Twilio Call SID
-    recording_url = Column(String)
-    transcript = Column(Text)
-    keypad_inputs = Column(JSON)  # Store keypad inputs
-    menu_selections = Column(JSON)  # Store menu selections
-    call_quality_metrics = Column(JSON)  # Store call quality metrics
-    model_metadata = Column(JSON)  # Additional call metadata
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    interaction_id = Column(UUID(as_uuid=True), ForeignKey('interaction_logs.id'))
+    call_sid = Column(String(34))  # Twilio Call SID (always 34 chars)
+    
+    # Bulky call payload, only loaded on access or with undefer_group("payload")
+    recording_url = deferred(Column(String), group="payload")
+    transcript = deferred(Column(Text), group="payload")
+    keypad_inputs = deferred(Column(JSONType), group="payload")  # Store keypad inputs
+    menu_selections = deferred(Column(JSONType), group="payload")  # Store menu selections
+    call_quality_metrics = deferred(Column(JSONType), group="payload")  # Store call quality metrics
+    model_metadata = deferred(Column(JSONType), group="payload")  # Additional call metadata
     
-    interaction = relationship("InteractionLog")
+    interaction = relationship("InteractionLog", lazy="joined")
 
 class MessageInteraction(Base):
     __tablename__ = "message_interactions"
     __table_args__ = {'extend_existing': True}
     
-    id = Column(String(36), primary_key=True, index=True)
-    interaction_id = Column(String(36), ForeignKey('interaction_logs.id'))
-    message_id = Column(String)  # Provider's message ID
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    interaction_id = Column(UUID(as_uuid=True), ForeignKey('interaction_logs.id'))
+    message_id = Column(String(255))  # Provider's message ID
     content = Column(Text)
     response_content = Column(Text)
     response_time = Column(Integer)  # Time to respond in seconds
-    delivery_status = Column(String)
-    model_metadata = Column(JSON)  # Additional message metadata
+    delivery_status = Column(String(32))  # Provider status code, e.g. "undelivered"
+    model_metadata = Column(JSONType)  # Additional message metadata
     
-    interaction = relationship("InteractionLog")
+    interaction = relationship("InteractionLog", lazy="joined")
 
 __all__ = [
     "InteractionType",
@@ -4,11 +4,14 @@ Notification models for the Real Estate AI platform.
 This module defines the Notification and NotificationPreference models for managing user notifications.
 """
 
-from datetime import datetime
+import uuid
+from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, Column, DateTime, ForeignKey, String
+from sqlalchemy import Boolean, Column, DateTime, ForeignKey, Index, String, Text, text
+from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.orm import relationship
+from sqlalchemy.sql import func
 
 from app.shared.db.base_class import Base
 
@@ -20,9 +23,9 @@ class Notification(Base):
     Notification model for storing user notifications.
     
     Attributes:
-        id (str): Unique identifier for the notification
+        id (UUID): Unique identifier for the notification
         user_id (str): ID of the user who owns this notification
-        customer_id (str): ID of the customer associated with this notification
+        customer_id (UUID): ID of the customer associated with this notification
         title (str): Notification title
         message (str): Notification message
         type (str): Type of notification (e.g., 'info', 'warning', 'error')
@@ -31,16 +34,26 @@ class Notification(Base):
         read_at (datetime): When the notification was read (if read)
     """
     __tablename__ = "notifications"
-
-    id = Column(String, primary_key=True, index=True)
+    __table_args__ = (
+        # A user's unread notifications, newest first; read ones are left out
+        # so the index stays small
+        Index(
+            "ix_notifications_unread", "user_id", "created_at",
+            postgresql_where=text("is_read = false")
+        ),
+        # A user's notifications, newest first
+        Index("ix_notifications_user_created", "user_id", "created_at"),
+    )
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(String, ForeignKey("users.id"), nullable=False)
-    customer_id = Column(String, ForeignKey("customers.id"), nullable=False)
-    title = Column(String, nullable=False)
-    message = Column(String, nullable=False)
-    type = Column(String, default="info")
+    customer_id = Column(UUID(as_uuid=True), ForeignKey("customers.id"), nullable=False)
+    title = Column(String(200), nullable=False)
+    message = Column(Text, nullable=False)
+    type = Column(String(50), default="info")
     is_read = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    read_at = Column(DateTime, nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    read_at = Column(DateTime(timezone=True), nullable=True)
 
     # Relationships
     user = relationship("User", back_populates="notifications")
@@ -52,16 +65,16 @@ class Notification(Base):
     def mark_as_read(self):
         """Mark the notification as read."""
         self.is_read = True
-        self.read_at = datetime.utcnow()
+        self.read_at = datetime.now(timezone.utc)
 
 class NotificationPreference(Base):
     """
     NotificationPreference model for storing user notification preferences.
     
     Attributes:
-        id (str): Unique identifier for the preference
+        id (UUID): Unique identifier for the preference
         user_id (str): ID of the user who owns these preferences
-        customer_id (str): ID of the customer associated with these preferences
+        customer_id (UUID): ID of the customer associated with these preferences
         email_enabled (bool): Whether email notifications are enabled
         push_enabled (bool): Whether push notifications are enabled
         sms_enabled (bool): Whether SMS notifications are enabled
@@ -70,14 +83,14 @@ class NotificationPreference(Base):
     """
     __tablename__ = "notification_preferences"
 
-    id = Column(String, primary_key=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
     user_id = Column(String, ForeignKey("users.id"), unique=True, nullable=False)
-    customer_id = Column(String, ForeignKey("customers.id"), nullable=False)
+    customer_id = Column(UUID(as_uuid=True), ForeignKey("customers.id"), nullable=False)
     email_enabled = Column(Boolean, default=True)
     push_enabled = Column(Boolean, default=True)
     sms_enabled = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
     # Relationships
     user = relationship("User", back_populates="notification_preferences")
@@ -99,6 +112,5 @@ class NotificationPreference(Base):
             self.push_enabled = push_enabled
         if sms_enabled is not None:
             self.sms_enabled = sms_enabled
-        self.updated_at = datetime.utcnow()
 
 __all__ = ["Notification", "NotificationPreference"] 
\ No newline at end of file
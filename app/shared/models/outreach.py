@@ -1,25 +1,6 @@
-from enum import Enum
+# Canonical definitions live with the outreach models, whose Enum columns use them
+from app.outreach.models.outreach import OutreachChannel, OutreachStatus
+# Outreach types are the interaction types; kept as an alias for existing imports
+from app.shared.models.interaction import InteractionType as OutreachType
 
-
-
-
-class OutreachChannel(str, Enum):
-    EMAIL = "email"
-    SMS = "sms"
-    WHATSAPP = "whatsapp"
-
-class OutreachStatus(str, Enum):
-    PENDING = "pending"
-    SENT = "sent"
-    FAILED = "failed"
-    DELIVERED = "delivered"
-    READ = "read"
-
-class OutreachType(Enum):
-    CALL = "call"
-    SMS = "sms"
-    EMAIL = "email"
-    WHATSAPP = "whatsapp"
-    TELEGRAM = "telegram"
-
-# Remove the OutreachTemplate class definition from this file. 
\ No newline at end of file
+# Remove the OutreachTemplate class definition from this file.
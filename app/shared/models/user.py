@@ -1,11 +1,14 @@
-from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from functools import lru_cache
+from typing import TYPE_CHECKING, FrozenSet, Optional, Tuple
 
-from sqlalchemy import (JSON, Boolean, Column, DateTime, ForeignKey, Integer, String, Table)
-from sqlalchemy.orm import relationship
+from sqlalchemy import (Boolean, Column, DateTime, ForeignKey, Index, Integer, String, Table,
+                        text)
+from sqlalchemy.orm import object_session, relationship
+from sqlalchemy.sql import func
 
 from app.shared.core.security.role_types import Role
 from app.shared.db.base_class import Base
+from app.shared.db.types import JSONType
 
 if TYPE_CHECKING:
     from app.shared.models.customer import Customer
@@ -26,8 +29,15 @@ role_permissions = Table(
     Column('permission_id', Integer, ForeignKey('permissions.id'), primary_key=True)
 )
 
+@lru_cache(maxsize=None)
+def _role_values(roles: Tuple[Role, ...]) -> FrozenSet[str]:
+    """Values of a role combination; guards reuse the same few combinations."""
+    return frozenset(role.value for role in roles)
+
 class UserRole:
     """User role management."""
+
+    __slots__ = ("user",)
     
     def __init__(self, user: 'User'):
         self.user = user
@@ -67,22 +77,28 @@ class User(Base):
         reset_token_expires (datetime): Expiration time for the reset token
     """
     __tablename__ = "users"
-    __table_args__ = {'extend_existing': True}
-
-    id = Column(String, primary_key=True, index=True)
-    email = Column(String, unique=True, index=True, nullable=False)
-    username = Column(String, unique=True, index=True, nullable=False)
+    __table_args__ = (
+        # Only users mid password reset carry a token; the rest stay out of the index
+        Index(
+            "ix_users_reset_token", "reset_token", unique=True,
+            postgresql_where=text("reset_token IS NOT NULL")
+        ),
+    )
+
+    id = Column(String, primary_key=True)
+    email = Column(String(254), unique=True, index=True, nullable=False)
+    username = Column(String(50), unique=True, index=True, nullable=False)
     first_name = Column(String(100), nullable=True)
     last_name = Column(String(100), nullable=True)
-    password_hash = Column(String, nullable=False)
+    password_hash = Column(String(60), nullable=False)  # bcrypt
     is_active = Column(Boolean(), default=True)
     is_superuser = Column(Boolean(), default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     customer_id = Column(String, ForeignKey("customers.id"), nullable=False)
     last_login = Column(DateTime, nullable=True)
-    model_metadata = Column(JSON, nullable=True)
-    reset_token = Column(String, unique=True, nullable=True)
+    model_metadata = Column(JSONType, nullable=True)  # Reassign, don't mutate in place
+    reset_token = Column(String(43), nullable=True)  # secrets.token_urlsafe(32)
     reset_token_expires = Column(DateTime, nullable=True)
     
     # Use string-based relationship references
@@ -103,7 +119,11 @@ class User(Base):
     lead_activities = relationship("app.lead.models.lead_activity.LeadActivity", back_populates="user")
     
     # Relationships
-    notifications = relationship("Notification", back_populates="user")
+    # Newest first; read through select() so only the rows asked for are loaded
+    notifications = relationship(
+        "Notification", back_populates="user", lazy="write_only",
+        order_by="desc(Notification.created_at)"
+    )
     notification_preferences = relationship("NotificationPreference", back_populates="user", uselist=False)
     roles = relationship("Role", secondary=user_roles, back_populates="users")
     audit_logs = relationship("AuditLog", back_populates="user", foreign_keys="[AuditLog.user_id]")
@@ -131,17 +151,22 @@ class User(Base):
         """Check if user is a guest."""
         return self.role == Role.GUEST.value
 
+    @property
+    def role_names(self) -> FrozenSet[str]:
+        """Names of the roles assigned to the user through user_roles."""
+        return frozenset(role.name for role in self.roles)
+
     def has_role(self, role: Role) -> bool:
         """Check if user has a specific role."""
-        return self.role == role.value
+        return role.value in self.role_names
 
     def has_any_role(self, *roles: Role) -> bool:
         """Check if user has any of the specified roles."""
-        return any(self.has_role(role) for role in roles)
+        return not self.role_names.isdisjoint(_role_values(roles))
 
     def has_all_roles(self, *roles: Role) -> bool:
         """Check if user has all of the specified roles."""
-        return all(self.has_role(role) for role in roles)
+        return _role_values(roles) <= self.role_names
 
     def get_notification_preference(self) -> Optional["NotificationPreference"]:
         """Get user's notification preferences."""
@@ -149,25 +174,25 @@ class User(Base):
 
     def get_unread_notifications(self) -> list["Notification"]:
         """Get user's unread notifications."""
-        return [n for n in self.notifications if not n.is_read]
+        return object_session(self).scalars(
+            self.notifications.select().filter_by(is_read=False)
+        ).all()
 
     def get_recent_notifications(self, limit: int = 10) -> list["Notification"]:
         """Get user's most recent notifications."""
-        return sorted(
-            self.notifications,
-            key=lambda x: x.created_at,
-            reverse=True
-        )[:limit]
+        return object_session(self).scalars(
+            self.notifications.select().limit(limit)
+        ).all()
 
 class Role(Base):
     """Role model for role-based access control."""
     __tablename__ = "roles"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, unique=True, nullable=False)
-    description = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), unique=True, nullable=False)
+    description = Column(String(255), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     users = relationship("User", secondary=user_roles, back_populates="roles")
@@ -180,11 +205,11 @@ class Permission(Base):
     """Permission model for fine-grained access control."""
     __tablename__ = "permissions"
 
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String, unique=True, nullable=False)
-    description = Column(String, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    id = Column(Integer, primary_key=True)
+    name = Column(String(50), unique=True, nullable=False)
+    description = Column(String(255), nullable=True)
+    created_at = Column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False)
     
     # Relationships
     roles = relationship("Role", secondary=role_permissions, back_populates="permissions")
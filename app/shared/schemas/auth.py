@@ -1,11 +1,11 @@
-from typing import Optional
-from pydantic import BaseModel, EmailStr, Field, constr, validator
-from sqlalchemy.orm import Session
-from app.shared.models.user import User
-from sqlalchemy.orm import Session
-from app.shared.models.user import User
-from datetime import datetime
 import re
+from datetime import datetime
+from typing import Optional
+from uuid import UUID
+
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+
+_USERNAME_RE = re.compile(r'[a-zA-Z0-9_]+')
 
 
 class Token(BaseModel):
@@ -24,9 +24,10 @@ class UserBase(BaseModel):
     is_active: bool = True
     is_superuser: bool = False
 
-    @validator('username')
+    @field_validator('username')
+    @classmethod
     def validate_username(cls, v):
-        if not re.match(r'^[a-zA-Z0-9_]+$', v):
+        if not _USERNAME_RE.fullmatch(v):
             raise ValueError('Username can only contain letters, numbers, and underscores')
         return v
 
@@ -40,9 +41,10 @@ class UserUpdate(BaseModel):
     last_name: Optional[str] = None
     password: Optional[str] = Field(None, min_length=8)
 
-    @validator('username')
+    @field_validator('username')
+    @classmethod
     def validate_username(cls, v):
-        if v is not None and not re.match(r'^[a-zA-Z0-9_]+$', v):
+        if v is not None and not _USERNAME_RE.fullmatch(v):
             raise ValueError('Username can only contain letters, numbers, and underscores')
         return v
 
@@ -56,8 +58,7 @@ class UserInDB(UserBase):
     reset_token: Optional[str] = None
     reset_token_expires: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class User(UserBase):
     id: int
@@ -68,8 +69,7 @@ class User(UserBase):
     reset_token: Optional[str] = None
     reset_token_expires: Optional[datetime] = None
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class UserLogin(BaseModel):
     username_or_email: str
@@ -112,13 +112,13 @@ class SessionCreate(BaseModel):
     user_agent: Optional[str] = None
 
 class SessionResponse(BaseModel):
-    id: str
+    id: UUID
     device_info: Optional[dict] = None
     ip_address: Optional[str] = None
     user_agent: Optional[str] = None
-    created_at: str
-    last_activity: str
-    expires_at: str
+    created_at: datetime
+    last_activity: datetime
+    expires_at: datetime
     is_active: bool
 
 class SessionList(BaseModel):
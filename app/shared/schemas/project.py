@@ -2,7 +2,7 @@ from datetime import datetime
 from typing import Any, Dict, List, Optional
 from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app.project.models.project import ProjectStatus, ProjectType, project_leads
 
@@ -49,8 +49,7 @@ class ProjectFeature(ProjectFeatureBase):
     id: int
     project_id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ProjectImageBase(BaseModel):
     url: str
@@ -63,8 +62,7 @@ class ProjectImage(ProjectImageBase):
     id: int
     project_id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ProjectAmenityBase(BaseModel):
     name: str
@@ -77,8 +75,7 @@ class ProjectAmenity(ProjectAmenityBase):
     id: int
     project_id: int
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ProjectLeadBase(BaseModel):
     name: str
@@ -95,8 +92,7 @@ class ProjectLead(ProjectLeadBase):
     project_id: int
     assigned_to_id: Optional[int] = None
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class Project(ProjectBase):
     """Schema for project response."""
@@ -110,10 +106,8 @@ class Project(ProjectBase):
     features: List[ProjectFeature] = []
     images: List[ProjectImage] = []
     amenities_list: List[ProjectAmenity] = []
-    leads: List[UUID] = []  # List of lead IDs instead of ProjectLead objects
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 class ProjectResponse(BaseModel):
     project: Project
@@ -1,13 +1,9 @@
 from datetime import datetime
 from typing import List, Optional
 
-from pydantic import BaseModel, EmailStr, Field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
 from app.shared.core.security.roles import Role
-from app.shared.models.user import User
-from datetime import datetime
-from app.shared.models.user import User
-from datetime import datetime
 
 
 class UserBase(BaseModel):
@@ -30,8 +26,7 @@ class UserInDBBase(UserBase):
     created_at: datetime
     updated_at: datetime
 
-    class Config:
-        orm_mode = True
+    model_config = ConfigDict(from_attributes=True)
 
 class User(UserInDBBase):
     pass
@@ -1,23 +1,57 @@
 import re
+import string
 from typing import Optional
 
 from pydantic import BaseModel, EmailStr, constr, validator
 from app.shared.models.user import User
 from app.shared.models.user import User
 
+_UPPERS = frozenset(string.ascii_uppercase)
+_LOWERS = frozenset(string.ascii_lowercase)
+_SPECIALS = frozenset('!@#$%^&*(),.?":{}|<>')
+_TIME_RE = re.compile(r'^([01]?[0-9]|2[0-3]):[0-5][0-9]$')
+
+
+def _validate_phone(v: Optional[str]) -> Optional[str]:
+    """
+    Check that a phone number fully matches \\+?1?\\d{9,15} without the regex engine.
+    
+    Unlike the old ^...$ regex match, a trailing newline is rejected.
+    """
+    if v is None:
+        return v
+    digits = v[1:] if v.startswith('+') else v
+    # A leading 1 may be a country code on top of the 9-15 digit number
+    if not (digits.isdecimal() and (9 <= len(digits) <= 15 or (len(digits) == 16 and digits[0] == '1'))):
+        raise ValueError('Phone number must be 9-15 digits, optionally prefixed with + and 1')
+    return v
+
 
 class PasswordValidation(BaseModel):
     password: constr(min_length=8, max_length=100)
     
     @validator('password')
     def password_strength(cls, v):
-        if not re.search(r'[A-Z]', v):
+        # One pass over the password instead of one regex scan per class
+        has_upper = has_lower = has_digit = has_special = False
+        for ch in v:
+            if ch in _UPPERS:
+                has_upper = True
+            elif ch in _LOWERS:
+                has_lower = True
+            elif ch.isdecimal():
+                has_digit = True
+            elif ch in _SPECIALS:
+                has_special = True
+            if has_upper and has_lower and has_digit and has_special:
+                break
+        if not has_upper:
             raise ValueError('Password must contain at least one uppercase letter')
-        if not re.search(r'[a-z]', v):
+        if not has_lower:
             raise ValueError('Password must contain at least one lowercase letter')
-        if not re.search(r'\d', v):
+        if not has_digit:
             raise ValueError('Password must contain at least one number')
-        if not re.search(r'[!@#$%^&*(),.?":{}|<>]', v):
+        if not has_special:
             raise ValueError('Password must contain at least one special character')
         return v
 
@@ -40,17 +74,25 @@ class UserUpdate(BaseModel):
 class LeadCreate(BaseModel):
     name: constr(min_length=1, max_length=255)
     email: Optional[EmailStr] = None
-    phone: Optional[constr(regex=r'^\+?1?\d{9,15}$')] = None
+    phone: Optional[str] = None
     source: Optional[str] = None
     notes: Optional[str] = None
 
+    @validator('phone')
+    def validate_phone(cls, v):
+        return _validate_phone(v)
+
 class LeadUpdate(BaseModel):
     name: Optional[constr(min_length=1, max_length=255)] = None
     email: Optional[EmailStr] = None
-    phone: Optional[constr(regex=r'^\+?1?\d{9,15}$')] = None
+    phone: Optional[str] = None
     status: Optional[str] = None
     notes: Optional[str] = None
 
+    @validator('phone')
+    def validate_phone(cls, v):
+        return _validate_phone(v)
+
 class ProjectCreate(BaseModel):
     name: constr(min_length=1, max_length=255)
     description: Optional[str] = None
@@ -91,6 +133,6 @@ class CommunicationPreferenceUpdate(BaseModel):
 
     @validator('quiet_hours_start', 'quiet_hours_end')
     def validate_time_format(cls, v):
-        if v and not re.match(r'^([01]?[0-9]|2[0-3]):[0-5][0-9]$', v):
+        if v and not _TIME_RE.match(v):
             raise ValueError('Time must be in 24-hour format (HH:MM)')
         return v 
\ No newline at end of file
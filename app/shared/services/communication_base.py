@@ -7,7 +7,7 @@ from sqlalchemy.orm import Session
 from twilio.rest import Client
 
 from app.shared.core.config import settings
-from app.shared.core.text_to_speech import TextToSpeechService
+from app.shared.core.text_to_speech import get_tts_service
 
 logger = logging.getLogger(__name__)
 
@@ -19,7 +19,7 @@ class CommunicationBaseService:
             settings.TWILIO_AUTH_TOKEN
         )
         self.from_number = settings.TWILIO_PHONE_NUMBER
-        self.tts_service = TextToSpeechService()
+        self.tts_service = get_tts_service()
 
     async def send_email(
         self,
@@ -0,0 +1,25 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+# Import the communication package first to settle its import cycle with sms
+import app.shared.core.communication  # noqa: F401
+from app.shared.core.security.dependencies import require_role
+from app.shared.core.security.role_types import Role
+
+def test_require_role_reuses_one_dependency_per_role_set():
+    """Test that routes asking for the same roles share one dependency"""
+    assert require_role([Role.ADMIN, Role.AGENT]) is require_role([Role.AGENT, Role.ADMIN])
+    assert require_role([Role.ADMIN]) is require_role([Role.ADMIN])
+    assert require_role([Role.ADMIN]) is not require_role([Role.ADMIN, Role.AGENT])
+
+@pytest.mark.asyncio
+async def test_require_role_checks_the_user_role():
+    """Test that the shared dependency admits allowed roles only"""
+    dependency = require_role([Role.ADMIN, Role.AGENT])
+    agent = SimpleNamespace(role=Role.AGENT.value)
+    assert await dependency(current_user=agent) is agent
+    with pytest.raises(HTTPException) as exc_info:
+        await dependency(current_user=SimpleNamespace(role=Role.CUSTOMER.value))
+    assert exc_info.value.status_code == 403
@@ -0,0 +1,97 @@
+import base64
+
+import pyotp
+import pytest
+
+from app.shared.core.security import security
+from app.shared.core.security.security import (
+    TOTP_INTERVAL,
+    _decode_totp_secret,
+    _is_well_formed_code,
+    _totp_code,
+    verify_mfa_code
+)
+
+# RFC 6238 appendix B SHA-1 seed and its base32 form
+RFC_SEED = b"12345678901234567890"
+RFC_SECRET = base64.b32encode(RFC_SEED).decode()
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Pin time.time() as seen by the security module."""
+    def freeze(timestamp):
+        monkeypatch.setattr(security.time, "time", lambda: timestamp)
+    return freeze
+
+@pytest.mark.parametrize("timestamp,expected", [
+    # 8-digit RFC values truncated to the 6 digits we issue
+    (59, b"287082"),
+    (1111111109, b"081804"),
+    (1111111111, b"050471"),
+    (1234567890, b"005924"),
+    (2000000000, b"279037"),
+    (20000000000, b"353130"),
+])
+def test_totp_code_matches_rfc6238_vectors(timestamp, expected):
+    """Test TOTP codes against the RFC 6238 SHA-1 test vectors"""
+    assert _totp_code(RFC_SEED, timestamp // TOTP_INTERVAL) == expected
+
+@pytest.mark.parametrize("timestamp", [59, 1111111109, 1234567890, 2000000000])
+def test_verify_mfa_code_accepts_rfc6238_vectors(frozen_time, timestamp):
+    """Test that the current step's code is accepted"""
+    frozen_time(timestamp)
+    code = _totp_code(RFC_SEED, timestamp // TOTP_INTERVAL).decode()
+    assert verify_mfa_code(code, RFC_SECRET)
+
+@pytest.mark.parametrize("offset,accepted", [
+    (-2, False),
+    (-1, True),
+    (0, True),
+    (1, True),
+    (2, False),
+])
+def test_verify_mfa_code_window(frozen_time, offset, accepted):
+    """Test that only codes from the adjacent time steps are accepted"""
+    now = 1234567890
+    frozen_time(now)
+    code = _totp_code(RFC_SEED, now // TOTP_INTERVAL + offset).decode()
+    assert verify_mfa_code(code, RFC_SECRET) is accepted
+
+def test_verify_mfa_code_matches_pyotp(frozen_time):
+    """Test parity with the pyotp codes provisioned by setup_mfa"""
+    secret = pyotp.random_base32()
+    now = 1700000000
+    frozen_time(now)
+    assert verify_mfa_code(pyotp.TOTP(secret).at(now), secret)
+
+@pytest.mark.parametrize("code", [
+    "",
+    "12345",
+    "1234567",
+    "12a456",
+    " 123456",
+    "123456\n",
+    "١٢٣٤٥٦",  # Arabic-Indic digits pass str.isdigit but are not ASCII
+    None,
+    123456,
+])
+def test_malformed_codes_are_rejected(frozen_time, code):
+    """Test that malformed codes are rejected without decoding the secret"""
+    frozen_time(1234567890)
+    assert not _is_well_formed_code(code)
+    # An undecodable secret proves the secret is never touched
+    assert verify_mfa_code(code, "not base32!") is False
+
+@pytest.mark.parametrize("secret", [
+    "NBSWY3DPEE======",  # padded
+    "NBSWY3DPEE",  # padding stripped, as authenticator apps display it
+    "nbswy3dpee",  # lower case
+])
+def test_decode_totp_secret_tolerates_missing_padding(secret):
+    """Test base32 secrets with and without padding"""
+    assert _decode_totp_secret(secret) == b"hello!"
+
+def test_decode_totp_secret_rejects_invalid_base32():
+    """Test that invalid base32 secrets raise"""
+    with pytest.raises(ValueError):
+        _decode_totp_secret("NBSWY3DP1")
@@ -0,0 +1,40 @@
+import subprocess
+import sys
+
+import pytest
+
+# Modules that hash or verify passwords; none should load passlib on import
+PASSWORD_MODULES = [
+    "app.shared.core.security",
+    "app.shared.core.security.auth_core",
+    "app.shared.core.security.auth_utils",
+    "app.shared.core.security.password",
+    "app.shared.core.security.password_utils",
+]
+
+@pytest.mark.parametrize("module", PASSWORD_MODULES)
+def test_importing_does_not_load_passlib(module):
+    """Test that passlib is only imported when a password is first hashed"""
+    script = (
+        "import sys\n"
+        "import app.shared.core.communication\n"
+        f"import {module}\n"
+        "print('passlib' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == "False"
+
+def test_password_helpers_share_one_implementation():
+    """Test that the legacy modules re-export the lazy helpers"""
+    import app.shared.core.communication  # noqa: F401
+    from app.shared.core.security import auth_core, password, password_utils
+
+    assert password.verify_password is password_utils.verify_password
+    assert password.get_password_hash is password_utils.get_password_hash
+    assert auth_core.verify_password is password_utils.verify_password
+    assert auth_core.get_password_hash is password_utils.get_password_hash
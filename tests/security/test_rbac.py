@@ -0,0 +1,40 @@
+import pytest
+
+# Import the communication package first to settle its import cycle with sms
+import app.shared.core.communication  # noqa: F401
+from app.shared.core.security import permissions, rbac
+from app.shared.core.security.permissions import PERMISSION_BITS, Permission
+from app.shared.core.security.role_types import Role
+
+def _unpack(mask):
+    return {permission for permission, bit in PERMISSION_BITS.items() if mask & bit}
+
+def test_rbac_uses_the_canonical_permission_enum():
+    """Test that rbac shares the Permission enum its bitmasks are keyed by"""
+    assert rbac.Permission is Permission
+    assert all(
+        type(permission) is Permission
+        for granted in rbac.ROLE_PERMISSIONS.values()
+        for permission in granted
+    )
+
+def test_every_permission_has_its_own_bit():
+    """Test that each permission maps to a distinct single bit"""
+    bits = [PERMISSION_BITS[permission] for permission in Permission]
+    assert len(set(bits)) == len(Permission)
+    assert all(bit & (bit - 1) == 0 for bit in bits)
+
+@pytest.mark.parametrize("role", list(Role))
+def test_role_masks_match_permission_sets(role):
+    """Test that each role's mask grants exactly its old permission set"""
+    expected = permissions.ROLE_PERMISSIONS[role]
+    assert _unpack(permissions.ROLE_PERMISSION_MASKS[role]) == expected
+    assert _unpack(rbac.ROLE_PERMISSION_MASKS[role]) == set(rbac.ROLE_PERMISSIONS[role])
+    assert set(rbac.ROLE_PERMISSIONS[role]) == expected
+
+@pytest.mark.parametrize("role", list(Role))
+@pytest.mark.parametrize("permission", list(Permission))
+def test_has_permission_matches_set_membership(role, permission):
+    """Test the bitmask check against the set-based lookup it replaced"""
+    expected = permission in permissions.ROLE_PERMISSIONS[role]
+    assert rbac.RBACService.has_permission(role, permission) is expected
@@ -0,0 +1,85 @@
+import importlib
+import sys
+import time
+from datetime import timedelta
+
+import pytest
+from jose import jwt
+
+from app.shared.core.config import settings
+from app.shared.core.security import tokens
+
+# Pinned clock; jose checks exp against the real clock, so stay near it
+FROZEN_NOW = int(time.time())
+
+@pytest.fixture
+def frozen_time(monkeypatch):
+    """Pin time.time() as seen by the tokens module."""
+    monkeypatch.setattr(tokens.time, "time", lambda: FROZEN_NOW)
+
+def _decode(token):
+    return jwt.decode(token, settings.SECRET_KEY, algorithms=["HS256"])
+
+@pytest.mark.parametrize("mint,token_type", [
+    (tokens.create_access_token, "access"),
+    (tokens.create_refresh_token, "refresh"),
+    (tokens.generate_verification_token, "email_verification"),
+    (tokens.generate_password_reset_token, "password_reset"),
+])
+def test_minted_tokens_decode_with_jose(mint, token_type):
+    """Test that hand-built HS256 tokens round-trip through jose"""
+    before = int(time.time())
+    payload = _decode(mint("user-123", timedelta(minutes=5)))
+    assert payload["sub"] == "user-123"
+    assert payload["type"] == token_type
+    assert isinstance(payload["exp"], int)
+    assert before + 300 <= payload["exp"] <= int(time.time()) + 300
+
+def test_header_is_standard_hs256():
+    """Test the precomputed JOSE header"""
+    token = tokens.create_access_token("user-123")
+    assert jwt.get_unverified_header(token) == {"alg": "HS256", "typ": "JWT"}
+
+def test_default_ttl_and_non_string_subject(frozen_time):
+    """Test the default access TTL and str() of non-string subjects"""
+    payload = _decode(tokens.create_access_token(42))
+    assert payload["sub"] == "42"
+    assert payload["exp"] == FROZEN_NOW + settings.ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+def test_decode_helpers_accept_minted_tokens():
+    """Test the module's own decoders against its minted tokens"""
+    token = tokens.create_access_token("user-123")
+    assert tokens.decode_access_token(token)["sub"] == "user-123"
+    assert tokens.verify_jwt_token(token)["sub"] == "user-123"
+    refresh = tokens.create_refresh_token("user-123")
+    assert tokens.decode_refresh_token(refresh)["type"] == "refresh"
+
+def test_expired_token_is_rejected():
+    """Test that the integer exp claim is enforced"""
+    token = tokens.create_access_token("user-123", timedelta(seconds=-10))
+    with pytest.raises(jwt.ExpiredSignatureError):
+        _decode(token)
+
+def test_tampered_token_is_rejected():
+    """Test that the signature covers the payload"""
+    header, payload, signature = tokens.create_access_token("user-123").split(".")
+    forged = tokens._b64url(b'{"exp":9999999999,"sub":"admin","type":"access"}').decode()
+    with pytest.raises(jwt.JWTError):
+        _decode(".".join((header, forged, signature)))
+
+@pytest.mark.parametrize("subject", ["user-123", "josé-日本"])
+def test_json_fallback_matches_orjson(frozen_time, monkeypatch, subject):
+    """Test that the json fallback mints byte-identical tokens"""
+    pytest.importorskip("orjson")
+    assert tokens.HAS_ORJSON
+    orjson_token = tokens.create_access_token(subject)
+    try:
+        with monkeypatch.context() as m:
+            m.setitem(sys.modules, "orjson", None)
+            fallback = importlib.reload(tokens)
+            assert not fallback.HAS_ORJSON
+            fallback_token = fallback.create_access_token(subject)
+    finally:
+        importlib.reload(tokens)
+    assert fallback_token == orjson_token
+    assert _decode(fallback_token)["sub"] == subject
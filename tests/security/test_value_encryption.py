@@ -0,0 +1,63 @@
+import base64
+import os
+
+import pytest
+from cryptography.fernet import Fernet
+
+from app.shared.core.security.security import (
+    AES_NONCE_SIZE,
+    AES_TAG_SIZE,
+    _DERIVED_KEY,
+    decrypt_value,
+    encrypt_value
+)
+
+@pytest.mark.parametrize("value", [
+    "JBSWY3DPEHPK3PXP",
+    "",
+    "ünïcødé ✓",
+    "x" * 10000,
+])
+def test_aes_gcm_round_trip(value):
+    """Test that encrypted values decrypt back to the original"""
+    encrypted = encrypt_value(value)
+    assert encrypted != value
+    assert decrypt_value(encrypted) == value
+
+def test_encryption_uses_a_fresh_nonce():
+    """Test that the same value encrypts differently each time"""
+    assert encrypt_value("secret") != encrypt_value("secret")
+
+def test_legacy_fernet_values_still_decrypt():
+    """Test values written by the previous Fernet implementation"""
+    legacy = Fernet(base64.urlsafe_b64encode(_DERIVED_KEY))
+    token = legacy.encrypt(b"JBSWY3DPEHPK3PXP").decode()
+    assert decrypt_value(token) == "JBSWY3DPEHPK3PXP"
+
+def test_fernet_values_from_another_key_are_rejected():
+    """Test that a Fernet token under a different key is not accepted"""
+    token = Fernet(Fernet.generate_key()).encrypt(b"secret").decode()
+    with pytest.raises(ValueError):
+        decrypt_value(token)
+
+def test_tampered_value_is_rejected():
+    """Test that flipping a ciphertext bit fails authentication"""
+    data = bytearray(base64.urlsafe_b64decode(encrypt_value("secret")))
+    data[-1] ^= 0x01
+    with pytest.raises(ValueError):
+        decrypt_value(base64.urlsafe_b64encode(bytes(data)).decode())
+
+@pytest.mark.parametrize("garbage", [
+    "",
+    "not base64 at all!",
+    "abc",  # bad base64 padding
+    "é",
+    base64.urlsafe_b64encode(b"short").decode(),
+    base64.urlsafe_b64encode(os.urandom(AES_NONCE_SIZE + AES_TAG_SIZE - 1)).decode(),
+    base64.urlsafe_b64encode(os.urandom(AES_NONCE_SIZE + AES_TAG_SIZE)).decode(),
+    base64.urlsafe_b64encode(os.urandom(64)).decode(),
+])
+def test_garbage_raises_value_error(garbage):
+    """Test that every kind of bad input surfaces as ValueError"""
+    with pytest.raises(ValueError):
+        decrypt_value(garbage)
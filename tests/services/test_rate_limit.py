@@ -0,0 +1,120 @@
+import asyncio
+import time
+
+import pytest
+
+from app.shared.core.infrastructure import rate_limit
+from app.shared.core.infrastructure.rate_limit import (AsyncTokenBucket,
+                                                       RedisRateLimiter)
+
+@pytest.mark.asyncio
+async def test_burst_up_to_capacity_does_not_wait():
+    """Test that a full bucket serves its capacity immediately"""
+    bucket = AsyncTokenBucket(capacity=5, refill_rate=1)
+    start = time.monotonic()
+    await bucket.acquire(5)
+    assert time.monotonic() - start < 0.05
+    assert bucket.tokens < 1
+
+@pytest.mark.asyncio
+async def test_acquire_waits_for_refill():
+    """Test that an empty bucket waits cost / refill_rate seconds"""
+    bucket = AsyncTokenBucket(capacity=5, refill_rate=50)
+    await bucket.acquire(5)
+    start = time.monotonic()
+    await bucket.acquire(2)  # 2 tokens at 50/s is 40ms
+    elapsed = time.monotonic() - start
+    assert 0.035 <= elapsed < 0.5
+
+@pytest.mark.asyncio
+async def test_refill_is_capped_at_capacity():
+    """Test that idle time does not bank tokens past capacity"""
+    bucket = AsyncTokenBucket(capacity=3, refill_rate=1000)
+    await bucket.acquire(3)
+    await asyncio.sleep(0.02)
+    bucket._refill()
+    assert bucket.tokens == 3
+
+@pytest.mark.asyncio
+async def test_waiters_are_served_in_order():
+    """Test that concurrent waiters each get their tokens, first come first served"""
+    bucket = AsyncTokenBucket(capacity=1, refill_rate=100)
+    served = []
+
+    async def take(i):
+        await bucket.acquire()
+        served.append(i)
+
+    await asyncio.gather(*(take(i) for i in range(4)))
+    assert served == [0, 1, 2, 3]
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cost", [6, 5.5, 100])
+async def test_cost_over_capacity_is_rejected(cost):
+    """Test that an unsatisfiable cost raises instead of waiting forever"""
+    bucket = AsyncTokenBucket(capacity=5, refill_rate=1)
+    with pytest.raises(ValueError):
+        await asyncio.wait_for(bucket.acquire(cost), timeout=1)
+    # Nothing was consumed
+    assert bucket.tokens == 5
+
+def test_bucket_is_usable_from_several_event_loops():
+    """Test that a bucket created outside any loop works on each new loop"""
+    bucket = AsyncTokenBucket(capacity=1, refill_rate=200)
+
+    async def contend():
+        # Two waiters force the lock to bind to the running loop
+        await asyncio.gather(bucket.acquire(), bucket.acquire())
+
+    asyncio.run(contend())
+    asyncio.run(contend())
+
+@pytest.fixture
+def fake_redis():
+    """An in-memory Redis that runs Lua scripts."""
+    fakeredis = pytest.importorskip("fakeredis")
+    pytest.importorskip("lupa")
+    return fakeredis.FakeAsyncRedis()
+
+@pytest.mark.asyncio
+async def test_redis_script_allows_up_to_max_requests(fake_redis):
+    """Test that the Lua script admits max_requests per window, per client"""
+    limiter = RedisRateLimiter(fake_redis, max_requests=3, window_seconds=60)
+    assert [await limiter.check_rate_limit("1.2.3.4") for _ in range(4)] == [True, True, True, False]
+    # Rejected requests are not recorded
+    assert await fake_redis.zcard("rate_limit:1.2.3.4") == 3
+    # Other clients have their own window
+    assert await limiter.check_rate_limit("5.6.7.8")
+
+@pytest.mark.asyncio
+async def test_redis_script_sets_window_ttl(fake_redis):
+    """Test that idle window keys expire on their own"""
+    limiter = RedisRateLimiter(fake_redis, max_requests=3, window_seconds=60, key_prefix="api")
+    await limiter.check_rate_limit("1.2.3.4")
+    assert 0 < await fake_redis.pttl("api:1.2.3.4") <= 60_000
+
+@pytest.mark.asyncio
+async def test_redis_script_drops_expired_requests(fake_redis):
+    """Test that requests older than the window no longer count"""
+    limiter = RedisRateLimiter(fake_redis, max_requests=2, window_seconds=60)
+    # Two requests recorded at the epoch, long outside the window
+    await fake_redis.zadd("rate_limit:1.2.3.4", {"old-1": 0, "old-2": 0})
+    assert await limiter.check_rate_limit("1.2.3.4")
+    members = await fake_redis.zrange("rate_limit:1.2.3.4", 0, -1)
+    assert len(members) == 1
+    assert members[0] not in (b"old-1", b"old-2")
+
+@pytest.mark.asyncio
+async def test_unreachable_redis_falls_back_to_local_limiter():
+    """Test that Redis errors are answered by the per-process limiter"""
+    fakeredis = pytest.importorskip("fakeredis")
+    limiter = RedisRateLimiter(fakeredis.FakeAsyncRedis(connected=False), max_requests=2, window_seconds=60)
+    assert [await limiter.check_rate_limit("1.2.3.4") for _ in range(3)] == [True, True, False]
+
+def test_redis_client_uses_short_timeouts():
+    """Test that a stalled Redis cannot hold requests for the TCP timeout"""
+    pytest.importorskip("redis")
+    client = rate_limit._get_redis_client("redis://localhost:6379/15")
+    kwargs = client.connection_pool.connection_kwargs
+    assert kwargs["socket_connect_timeout"] == rate_limit.REDIS_CONNECT_TIMEOUT
+    assert kwargs["socket_timeout"] == rate_limit.REDIS_SOCKET_TIMEOUT
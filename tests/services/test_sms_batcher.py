@@ -0,0 +1,116 @@
+import asyncio
+import time
+
+import pytest
+
+# Import the communication package first to settle its import cycle with sms
+import app.shared.core.communication  # noqa: F401
+from app.shared.core import sms
+
+@pytest.fixture
+def batcher(monkeypatch):
+    """A fresh batcher that records the size of every batch it sends."""
+    batcher = sms._SMSBatcher()
+    batcher.sizes = []
+    send_batch = batcher._send_batch
+
+    async def recording_send_batch(batch):
+        batcher.sizes.append(len(batch))
+        await send_batch(batch)
+
+    monkeypatch.setattr(batcher, "_send_batch", recording_send_batch)
+    return batcher
+
+def _send(result):
+    async def send():
+        return result
+    return send
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting_for_window(batcher, monkeypatch):
+    """Test that SMS_BATCH_MAX queued sends go out before the window closes"""
+    monkeypatch.setattr(sms, "SMS_BATCH_WINDOW", 10)
+    monkeypatch.setattr(sms, "SMS_BATCH_MAX", 4)
+    start = time.monotonic()
+    results = await asyncio.wait_for(
+        asyncio.gather(*(batcher.submit(_send(i)) for i in range(4))),
+        timeout=1
+    )
+    assert results == [0, 1, 2, 3]
+    assert batcher.sizes == [4]
+    assert time.monotonic() - start < 1
+    await batcher.aclose()
+
+@pytest.mark.asyncio
+async def test_partial_batch_flushes_when_window_closes(batcher, monkeypatch):
+    """Test that a batch short of SMS_BATCH_MAX is sent after SMS_BATCH_WINDOW"""
+    monkeypatch.setattr(sms, "SMS_BATCH_WINDOW", 0.05)
+    start = time.monotonic()
+    results = await asyncio.gather(*(batcher.submit(_send(i)) for i in range(3)))
+    assert results == [0, 1, 2]
+    assert batcher.sizes == [3]
+    assert time.monotonic() - start >= 0.05
+    await batcher.aclose()
+
+@pytest.mark.asyncio
+async def test_failures_reach_only_their_caller(batcher):
+    """Test that one failed send does not fail the rest of its batch"""
+    async def fail():
+        raise RuntimeError("boom")
+
+    ok, failed = await asyncio.gather(
+        batcher.submit(_send("ok")),
+        batcher.submit(fail),
+        return_exceptions=True
+    )
+    assert ok == "ok"
+    assert isinstance(failed, RuntimeError)
+    await batcher.aclose()
+
+@pytest.mark.asyncio
+async def test_aclose_delivers_queued_sends_and_stops(batcher, monkeypatch):
+    """Test that aclose flushes a pending batch instead of dropping it"""
+    monkeypatch.setattr(sms, "SMS_BATCH_WINDOW", 10)
+    pending = [asyncio.ensure_future(batcher.submit(_send(i))) for i in range(3)]
+    await asyncio.sleep(0.01)
+    assert not any(task.done() for task in pending)
+
+    worker = batcher._task
+    await asyncio.wait_for(batcher.aclose(), timeout=1)
+    assert worker.done()
+    assert [task.result() for task in pending] == [0, 1, 2]
+    assert batcher.sizes == [3]
+
+@pytest.mark.asyncio
+async def test_aclose_without_sends_is_a_no_op(batcher):
+    """Test that closing an unstarted batcher does nothing"""
+    await batcher.aclose()
+    assert batcher._task is None
+
+@pytest.mark.asyncio
+async def test_batcher_restarts_after_aclose(batcher):
+    """Test that a closed batcher starts a new worker on the next send"""
+    assert await batcher.submit(_send(1)) == 1
+    await batcher.aclose()
+    assert await batcher.submit(_send(2)) == 2
+    await batcher.aclose()
+
+def test_batcher_follows_the_running_loop(batcher):
+    """Test that a batcher used on one loop starts afresh on the next"""
+    assert asyncio.run(batcher.submit(_send(1))) == 1
+    assert asyncio.run(batcher.submit(_send(2))) == 2
+
+@pytest.mark.asyncio
+async def test_services_share_one_batcher(monkeypatch):
+    """Test that every SMSService queues into the module-level batcher"""
+    async def deliver(self, to_number, message, customer_id, retry_count):
+        return {"status": "success", "to": to_number}
+
+    monkeypatch.setattr(sms.SMSService, "_deliver_sms", deliver)
+    results = await asyncio.gather(
+        sms.SMSService().send_sms_with_rate_limit("+15550000001", "hi"),
+        sms.SMSService().send_sms_with_rate_limit("+15550000002", "hi")
+    )
+    assert [r["to"] for r in results] == ["+15550000001", "+15550000002"]
+    await sms.close_sms_batcher()
+    assert sms._batcher._task is None
@@ -0,0 +1,63 @@
+import threading
+from types import SimpleNamespace
+
+import pytest
+
+# Import the communication package first to settle its import cycle with sms
+import app.shared.core.communication  # noqa: F401
+from app.shared.core import sms
+
+class FakeMessages:
+    """Records messages.create calls and the thread they ran on."""
+
+    def __init__(self):
+        self.calls = []
+
+    def create(self, **params):
+        self.calls.append((params, threading.current_thread().name))
+        return SimpleNamespace(sid="SM123")
+
+@pytest.fixture
+def service(monkeypatch):
+    """An SMSService wired to a fake Twilio client."""
+    monkeypatch.setenv("TWILIO_WHATSAPP_NUMBER", "+15550000000")
+    service = sms.SMSService()
+    service.client = SimpleNamespace(messages=FakeMessages())
+    return service
+
+@pytest.mark.asyncio
+async def test_send_sms_runs_on_twilio_pool(service):
+    """Test that the async send hands the Twilio call to the thread pool"""
+    assert await service.send_sms("+15550000001", "hi")
+    (params, thread), = service.client.messages.calls
+    assert params["to"] == "+15550000001"
+    assert params["body"] == "hi"
+    assert thread.startswith("twilio")
+
+@pytest.mark.parametrize("call,expected_to,expected_body", [
+    (lambda s: s.send_sms_sync("+15550000001", "hi"), "+15550000001", "hi"),
+    (lambda s: s.send_whatsapp_sync("+15550000001", "hi"), "whatsapp:+15550000001", "hi"),
+    (
+        lambda s: s.send_verification_code_sync("+15550000001", "123456"),
+        "+15550000001",
+        "Your verification code is: 123456"
+    ),
+    (
+        lambda s: s.send_notification_sync("+15550000001", "viewing", {"when": "today"}, use_whatsapp=True),
+        "whatsapp:+15550000001",
+        "Notification: viewing\nwhen: today\n"
+    ),
+])
+def test_sync_wrappers_send_without_an_event_loop(service, call, expected_to, expected_body):
+    """Test that the *_sync variants block and send through the same path"""
+    assert call(service) is True
+    (params, _), = service.client.messages.calls
+    assert params["to"] == expected_to
+    assert params["body"] == expected_body
+
+@pytest.mark.asyncio
+async def test_sync_wrapper_refuses_a_running_loop(service):
+    """Test that a sync wrapper cannot be used to block the event loop"""
+    with pytest.raises(RuntimeError):
+        service.send_sms_sync("+15550000001", "hi")
+    assert not service.client.messages.calls
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import Mock, patch
 from pathlib import Path
@@ -164,4 +165,77 @@ def test_generate_temp_audio(tts_service, mock_requests):
     assert Path(temp_path).suffix == ".mp3"
     
     # Clean up
-    os.remove(temp_path) 
\ No newline at end of file
+    os.remove(temp_path)
+
+
+@pytest.fixture
+def coalescing_service(tmp_path, monkeypatch):
+    """A service whose generation blocks until the test releases it."""
+    monkeypatch.chdir(tmp_path)
+    service = TextToSpeechService()
+    service.release = asyncio.Event()
+    service.loads = 0
+
+    async def load_audio(text, voice_id, cache_key):
+        service.loads += 1
+        await service.release.wait()
+        if text == "fail":
+            raise ValueError("upstream failed")
+        return f"cache/audio/{cache_key}.mp3"
+
+    service._load_audio = load_audio
+    return service
+
+async def _start(service, text):
+    task = asyncio.ensure_future(service.generate_audio(text))
+    await asyncio.sleep(0)
+    return task
+
+@pytest.mark.asyncio
+async def test_identical_requests_share_one_generation(coalescing_service):
+    """Test that concurrent identical requests are generated once"""
+    tasks = [await _start(coalescing_service, "hello") for _ in range(3)]
+    coalescing_service.release.set()
+    paths = await asyncio.gather(*tasks)
+    assert len(set(paths)) == 1
+    assert coalescing_service.loads == 1
+    assert not coalescing_service._inflight
+
+@pytest.mark.asyncio
+async def test_cancelling_the_leader_does_not_fail_joiners(coalescing_service):
+    """Test that joiners still get the audio when the first caller is cancelled"""
+    leader = await _start(coalescing_service, "hello")
+    joiner = await _start(coalescing_service, "hello")
+    leader.cancel()
+    await asyncio.sleep(0)
+    coalescing_service.release.set()
+
+    assert (await joiner).endswith(".mp3")
+    with pytest.raises(asyncio.CancelledError):
+        await leader
+    assert coalescing_service.loads == 1
+
+@pytest.mark.asyncio
+async def test_generation_outlives_cancelled_callers(coalescing_service):
+    """Test that a generation every caller abandoned still completes once"""
+    leader = await _start(coalescing_service, "hello")
+    leader.cancel()
+    await asyncio.sleep(0)
+    generation = coalescing_service._inflight[coalescing_service._get_cache_key("hello", "default")]
+    coalescing_service.release.set()
+    await generation
+    assert not coalescing_service._inflight
+
+@pytest.mark.asyncio
+async def test_failed_generation_reaches_every_caller(coalescing_service):
+    """Test that a failure is reported to all joiners and not cached"""
+    tasks = [await _start(coalescing_service, "fail") for _ in range(2)]
+    coalescing_service.release.set()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert not coalescing_service._inflight
+
+    # The next request starts a fresh generation
+    with pytest.raises(RuntimeError):
+        await coalescing_service.generate_audio("fail")
+    assert coalescing_service.loads == 2
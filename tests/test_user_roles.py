@@ -0,0 +1,42 @@
+import pytest
+
+# Import the communication package first to settle its import cycle with sms
+import app.shared.core.communication  # noqa: F401
+import app.models_registry  # noqa: F401
+from app.shared.core.security.role_types import Role as RoleType
+from app.shared.models.user import Role, User
+
+@pytest.fixture
+def agent_admin():
+    """A user holding the admin and agent roles."""
+    return User(email="agent@example.com", roles=[Role(name="admin"), Role(name="agent")])
+
+def test_role_names_come_from_assigned_roles(agent_admin):
+    """Test that role names are read through User.roles"""
+    assert agent_admin.role_names == {"admin", "agent"}
+    assert User(email="nobody@example.com").role_names == frozenset()
+
+def test_has_role(agent_admin):
+    """Test single role checks"""
+    assert agent_admin.has_role(RoleType.ADMIN)
+    assert not agent_admin.has_role(RoleType.CUSTOMER)
+
+@pytest.mark.parametrize("roles,expected", [
+    ((RoleType.ADMIN,), True),
+    ((RoleType.CUSTOMER, RoleType.AGENT), True),
+    ((RoleType.CUSTOMER, RoleType.GUEST), False),
+    ((), False),
+])
+def test_has_any_role(agent_admin, roles, expected):
+    """Test that any one assigned role satisfies has_any_role"""
+    assert agent_admin.has_any_role(*roles) is expected
+
+@pytest.mark.parametrize("roles,expected", [
+    ((RoleType.ADMIN, RoleType.AGENT), True),
+    ((RoleType.AGENT,), True),
+    ((RoleType.ADMIN, RoleType.CUSTOMER), False),
+    ((), True),
+])
+def test_has_all_roles(agent_admin, roles, expected):
+    """Test that has_all_roles needs every requested role"""
+    assert agent_admin.has_all_roles(*roles) is expected
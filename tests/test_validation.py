@@ -0,0 +1,129 @@
+import random
+import re
+
+import pytest
+from pydantic import ValidationError
+
+# Import the communication package first to settle its import cycle with sms
+import app.shared.core.communication  # noqa: F401
+from app.shared.schemas.validation import (LeadCreate, PasswordValidation,
+                                           _validate_phone)
+
+PHONE_PATTERN = r'\+?1?\d{9,15}'
+
+# The regex checks password_strength replaced, in their original order
+OLD_PASSWORD_CHECKS = [
+    (re.compile(r'[A-Z]'), 'Password must contain at least one uppercase letter'),
+    (re.compile(r'[a-z]'), 'Password must contain at least one lowercase letter'),
+    (re.compile(r'\d'), 'Password must contain at least one number'),
+    (re.compile(r'[!@#$%^&*(),.?":{}|<>]'), 'Password must contain at least one special character'),
+]
+
+# ASCII classes plus look-alikes the old regexes did not count: non-ASCII
+# letters, the Kelvin sign, Unicode decimal digits (which \d does count),
+# superscripts and other punctuation
+PASSWORD_ALPHABET = (
+    "ABCXYZabcxyz0189!@#$%^&*(),.?\":{}|<>"
+    "ÀÉÑßéñıſKΩω٣५²½~_-+=[]/ \t"
+)
+
+def _accepts(v):
+    try:
+        _validate_phone(v)
+    except ValueError:
+        return False
+    return True
+
+def _random_phones(count, seed=1234):
+    """Near-valid numbers: optional + and 1, 7-17 digits, sometimes corrupted."""
+    rng = random.Random(seed)
+    phones = []
+    for _ in range(count):
+        phone = rng.choice(["", "+"]) + rng.choice(["", "1"])
+        phone += "".join(rng.choice("0123456789٣") for _ in range(rng.randint(7, 17)))
+        if rng.random() < 0.3:
+            at = rng.randint(0, len(phone))
+            phone = phone[:at] + rng.choice(" -+\na") + phone[at:]
+        phones.append(phone)
+    return phones
+
+@pytest.mark.parametrize("phone", [
+    "",
+    "+",
+    "12345678",  # 8 digits
+    "123456789",  # 9 digits
+    "+123456789",
+    "123456789012345",  # 15 digits
+    "1234567890123456",  # 16 digits, leading 1 read as country code
+    "+1234567890123456",
+    "2234567890123456",  # 16 digits without a leading 1
+    "11234567890123456",  # 17 digits
+    "++123456789",
+    "+1 234 567 8901",
+    "123-456-7890",
+    "١٢٣٤٥٦٧٨٩",  # Arabic-Indic digits, matched by \d
+    "12345678a",
+    "123456789\n",
+] + _random_phones(500))
+def test_validate_phone_matches_regex_fullmatch(phone):
+    """Test the string checks against a full match of the old pattern"""
+    assert _accepts(phone) is bool(re.fullmatch(PHONE_PATTERN, phone))
+
+def test_trailing_newline_is_now_rejected():
+    """Test the one deliberate change: ^...$ used to accept a trailing newline"""
+    assert re.match(r'^\+?1?\d{9,15}$', "123456789\n")
+    assert not _accepts("123456789\n")
+
+def test_none_phone_is_allowed():
+    """Test that a missing phone number passes through"""
+    assert _validate_phone(None) is None
+
+def test_lead_schema_uses_phone_validation():
+    """Test that LeadCreate rejects invalid phone numbers"""
+    assert LeadCreate(name="Lead", phone="+15551234567").phone == "+15551234567"
+    with pytest.raises(ValidationError):
+        LeadCreate(name="Lead", phone="555-1234")
+
+def _old_password_error(v):
+    for pattern, message in OLD_PASSWORD_CHECKS:
+        if not pattern.search(v):
+            return message
+    return None
+
+def _password_error(v):
+    try:
+        PasswordValidation(password=v)
+    except ValidationError as e:
+        # Only the password field's error; the model has other required fields
+        for error in e.errors():
+            if error["loc"] == ("password",):
+                return error["msg"].removeprefix("Value error, ")
+    return None
+
+def _random_passwords(count, seed=4321):
+    rng = random.Random(seed)
+    return [
+        "".join(rng.choice(PASSWORD_ALPHABET) for _ in range(rng.randint(8, 16)))
+        for _ in range(count)
+    ]
+
+@pytest.mark.parametrize("password", [
+    "Abcdef1!",
+    "abcdef1!",  # no upper case
+    "ABCDEF1!",  # no lower case
+    "Abcdefg!",  # no digit
+    "Abcdefg1",  # no special character
+    "ÀbcdefG1!",
+    "Àbcdef1!",  # only a non-ASCII upper case letter
+    "ABCDEFñ1!",  # only a non-ASCII lower case letter
+    "ABCDEFſ1!",  # long s, lower case only outside ASCII
+    "KABCDEF1!",  # Kelvin sign
+    "Abcdef٣!",  # Arabic-Indic digit, matched by \d
+    "Abcdef५!",  # Devanagari digit, matched by \d
+    "Abcdef²!",  # superscript two is a digit but not a decimal
+    "Abcdef1~",  # special character outside the accepted set
+    "Abcdefg1\n",
+] + _random_passwords(1000))
+def test_password_strength_matches_old_regexes(password):
+    """Test the single-pass check against the four regex searches it replaced"""
+    assert _password_error(password) == _old_password_error(password)